@@ -1,19 +1,20 @@
 import streamlit as st
+import io
 import math
 
 
-### CIRCLE OF FIFTHS imports
-from circle_of_fifths import draw_circle_of_fifths
-
 ### For our mode notes and degrees 
-from note_sets import get_scale_notes_and_degrees, mode_descriptions
+from note_sets import get_scale_notes_and_degrees, mode_descriptions, note_index
 
 ### CHORD imports
 from chords import   show_related_chords_section, degree_names, mode_intervals, parallel_modes, get_borrowed_chords, earth_note_colors, _light_note_colors, chord_intervals, calculate_chord_notes, circle_of_fifths_notes, format_chord_name,progression_to_root_notes, chord_symbols, get_chord_type_from_part
 
-### FRETBOARD imports
+### FRETBOARD imports (the SVG path is pure Python; matplotlib is only imported for PNG renders)
 from fretboard_visual import guitar_fretboard_visualization
 
+# The circle of fifths (matplotlib) and batch chord lookups (NumPy) are imported inside the
+# sections that use them, so a cold start with no diagrams open skips those packages entirely.
+
 
 # # Check if navigation query param is set and redirect
 # query_params = st.experimental_get_query_params()
@@ -149,6 +150,21 @@ def format_chord_name(chord_type):
     return abbreviations.get(chord_type, chord_type)  # Default to raw chord type if no abbreviation is found
 
 
+@st.cache_data(max_entries=8, show_spinner='Detecting notes...')
+def detect_recording_notes(recording_bytes):
+    """NoteEvents for an uploaded WAV, cached on its bytes so widget reruns don't redo the YIN pass."""
+    from pitch_detection import detect_notes, open_wav
+    return detect_notes(*open_wav(io.BytesIO(recording_bytes)))
+
+
+@st.cache_data(max_entries=8, show_spinner='Recognizing chords...')
+def recognize_recording_chords(recording_bytes):
+    """ChordSegments for an uploaded WAV, cached on its bytes so widget reruns don't redo the chromagram."""
+    from chord_recognition import recognize_chords
+    from pitch_detection import open_wav
+    return recognize_chords(*open_wav(io.BytesIO(recording_bytes)))
+
+
 
 
 # Streamlit app title
@@ -181,15 +197,27 @@ def main_streamlit_layout():
     chord_notes, chord_degrees = calculate_chord_notes(root_note, chord_type)
     st.write(f"{root_note} {format_chord_name(chord_type)}: {chord_notes} = {chord_degrees}")
     
+    render_backend = st.selectbox('Select the diagram renderer:', ['SVG', 'PNG'], key='render_backend_select').lower()
+
     if st.checkbox('Show Circle of Fifths', key='show_circle_of_fifths'):
-        draw_circle_of_fifths(root_note, chord_notes, chord_degrees)
+        from circle_of_fifths import draw_circle_of_fifths
+        draw_circle_of_fifths(root_note, chord_notes, chord_degrees, output=render_backend)
     
     selected_palette = st.selectbox('Select the color palette:', ['Soft', 'Earth'], key='color_palette_select')
     note_colors = earth_note_colors if selected_palette == 'Earth' else _light_note_colors
 
     if st.checkbox('Show guitar fretboard visualization', key='guitar_fretboard_visualization'):
-        guitar_fretboard_visualization(note_colors, chord_notes, chord_degrees, show_degrees=True)
+        guitar_fretboard_visualization(note_colors, chord_notes, chord_degrees, show_degrees=True, backend=render_backend)
 
+    if st.checkbox('Show playable voicings', key='playable_voicings'):
+        from music_core.voicings import find_voicings, format_voicing
+
+        max_span = st.slider('Maximum fret span:', 2, 5, 3, key='voicing_max_span')
+        root_in_bass = st.checkbox('Root in the bass', value=True, key='voicing_root_in_bass')
+        allow_open = st.checkbox('Allow open strings', value=True, key='voicing_allow_open')
+        voicings = find_voicings(root_note, chord_type, max_span=max_span, root_in_bass=root_in_bass, allow_open=allow_open)
+        st.write(f"{len(voicings)} voicings (low E to high E, x = muted):")
+        st.write(', '.join(format_voicing(voicing) for voicing in voicings[:40]))
 
 
     if st.checkbox('Show related chords', key='related_chords_checkbox'):
@@ -206,17 +234,50 @@ def main_streamlit_layout():
         )
         selected_progression = progression_choices[selected_description]
 
+        from chord_batch import batch_chord_notes, batch_chord_names, chord_type_ids
+
         progression_parts = selected_progression.split('-')
-        for index, part in enumerate(progression_parts):
-            chord_type = get_chord_type_from_part(part)
-            progression_root_notes = progression_to_root_notes(root_note, part)
-            for prog_root in progression_root_notes:
-                chord_notes, chord_degrees = calculate_chord_notes(prog_root, chord_type)
-                display_symbol = chord_symbols[chord_type]
-                st.write(f"{prog_root} {display_symbol}: {chord_notes} = {chord_degrees}")
-                # Checkbox for each chord's guitar fretboard visualization
-                if st.checkbox(f"Show fretboard for {prog_root} {display_symbol}", key=f'fretboard_{index}'):
-                    guitar_fretboard_visualization(note_colors, chord_notes, chord_degrees, show_degrees=True)
+        progression_types = [get_chord_type_from_part(part) for part in progression_parts]
+        progression_roots = progression_to_root_notes(root_note, selected_progression)
+        # Resolve every chord of the progression in one batch lookup
+        progression_chords = batch_chord_names(*batch_chord_notes(
+            [note_index[prog_root] for prog_root in progression_roots],
+            [chord_type_ids[prog_type] for prog_type in progression_types],
+        ))
+        for index, (prog_root, chord_type, (chord_notes, chord_degrees)) in enumerate(zip(progression_roots, progression_types, progression_chords)):
+            display_symbol = chord_symbols[chord_type]
+            st.write(f"{prog_root} {display_symbol}: {chord_notes} = {chord_degrees}")
+            # Checkbox for each chord's guitar fretboard visualization
+            if st.checkbox(f"Show fretboard for {prog_root} {display_symbol}", key=f'fretboard_{index}'):
+                guitar_fretboard_visualization(note_colors, chord_notes, chord_degrees, show_degrees=True, backend=render_backend)
+
+        if st.checkbox('Suggest smooth voicings', key='progression_voice_leading'):
+            from music_core.voicings import format_voicing
+            from voice_leading import progression_voicings
+
+            leading_span = st.slider('Maximum fret span:', 2, 5, 3, key='voice_leading_max_span')
+            try:
+                led_chords, leading_cost = progression_voicings(selected_progression, root_note, max_span=leading_span)
+            except ValueError as error:
+                st.write(str(error))
+            else:
+                st.table([
+                    {'Chord': f"{led_root}{chord_symbols[led_type]}", 'Shape (low E to high E)': format_voicing(led_voicing)}
+                    for led_root, led_type, led_voicing in led_chords
+                ])
+                st.write(f"Total movement cost: {leading_cost:.1f}")
+
+        if st.checkbox('Play progression audio', key='progression_audio'):
+            from audio_export import write_wav
+            from progression_audio import VOICINGS, render_progression
+            from timbre import TIMBRES
+
+            tempo = st.slider('Tempo (BPM):', 40, 200, 90, key='progression_tempo')
+            voicing = st.selectbox('Voicing:', list(VOICINGS), key='progression_voicing')
+            timbre = st.selectbox('Timbre:', list(TIMBRES), index=list(TIMBRES).index('pluck'), key='progression_timbre')
+            # Cached per (progression, key, tempo, voicing, timbre): only the first render synthesizes
+            progression_samples = render_progression(selected_progression, root_note, tempo, voicing=voicing, timbre=timbre)
+            st.audio(write_wav(lambda: [progression_samples], 44100), format='audio/wav')
 
 
 
@@ -232,10 +293,45 @@ def main_streamlit_layout():
             for (b_root, b_type, b_notes, b_degrees) in borrowed_chords:
                 st.write(f"{b_root} {format_chord_name(b_type)}: {b_notes} = {b_degrees}")
                 if st.checkbox(f"Show fretboard for {b_root} {format_chord_name(b_type)}", key=f'fretboard_borrowed_{b_root}'):
-                    guitar_fretboard_visualization(note_colors, b_notes, b_degrees, show_degrees=True)
+                    guitar_fretboard_visualization(note_colors, b_notes, b_degrees, show_degrees=True, backend=render_backend)
                     
         display_borrowed_chords(borrowed_chords,scale_notes)
 
+    if st.checkbox('Detect notes from a recording', key='detect_notes_from_recording'):
+        recording = st.file_uploader('Upload a WAV recording of a riff:', type=['wav'], key='recording_upload')
+        if recording is not None:
+            from pitch_detection import fretboard_positions
+
+            note_events = detect_recording_notes(recording.getvalue())
+            if note_events:
+                st.table([
+                    {
+                        'Time (s)': f"{event.start:.2f} - {event.end:.2f}",
+                        'Note': event.note,
+                        'Frequency (Hz)': round(event.frequency, 2),
+                        'Positions': ', '.join(f"{string} fret {fret}" for string, fret in fretboard_positions(event.midi)),
+                    }
+                    for event in note_events
+                ])
+                # Light up every detected pitch class, in the order they were first played
+                detected_notes = list(dict.fromkeys(event.note for event in note_events))
+                guitar_fretboard_visualization(note_colors, detected_notes, detected_notes, show_degrees=False, backend=render_backend)
+            else:
+                st.write("No pitched notes detected.")
+
+    if st.checkbox('Recognize chords in a recording', key='recognize_chords_from_recording'):
+        chord_recording = st.file_uploader('Upload a WAV recording of strummed chords:', type=['wav'], key='chord_recording_upload')
+        if chord_recording is not None:
+            chord_segments = recognize_recording_chords(chord_recording.getvalue())
+            if chord_segments:
+                st.write(' | '.join(segment.label for segment in chord_segments))
+                st.table([
+                    {'Time (s)': f"{segment.start:.2f} - {segment.end:.2f}", 'Chord': segment.label}
+                    for segment in chord_segments
+                ])
+            else:
+                st.write("Recording is too short to analyze.")
+
     if st.checkbox('Show Mode Details', key='show_mode_details'):
         mode_choice = st.selectbox('Select a mode to explore:', list(mode_intervals.keys()), key='mode_select_details')
         mode_info = mode_descriptions.get(mode_choice, {'simple': 'No description available.', 'deep': ''})
@@ -258,8 +354,25 @@ def main_streamlit_layout():
     
 
 
+def show_render_stats():
+    """Sidebar readout of figure and render-cache usage for monitoring long-running servers."""
+    from figure_manager import figure_manager
+    from fretboard_visual import fretboard_render_cache
+    from circle_of_fifths import circle_render_cache
+
+    stats = figure_manager.stats()
+    rss = f"{stats['rss_bytes'] / 2**20:.1f} MB" if stats['rss_bytes'] else 'n/a'
+    st.sidebar.write(f"Figures: {stats['in_use']} in use, {stats['pooled']} pooled, {stats['created']} created, {stats['pyplot_open']} open in pyplot")
+    st.sidebar.write(f"Process memory: {rss}")
+    st.sidebar.write(f"Fretboard cache: {fretboard_render_cache.stats()}")
+    st.sidebar.write(f"Circle cache: {circle_render_cache.stats()}")
+
+
 main_streamlit_layout()
 
+if st.sidebar.checkbox('Show render stats', key='show_render_stats'):
+    show_render_stats()
+
 
 
 #     circle_of_fifths_notes = ['C', 'G', 'D', 'A', 'E', 'B', 'F♯/Gb', 'Db', 'Ab', 'Eb', 'Bb', 'F']
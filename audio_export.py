@@ -0,0 +1,65 @@
+"""
+16-bit PCM WAV export for synthesized audio.
+
+Audio is written block by block: a first pass over the blocks finds the peak, a second pass
+normalizes, applies TPDF dither, quantizes and writes each block straight into the WAV
+container. Only one block of float and int16 samples exists at a time; the encoded WAV is
+returned as bytes, which st.audio accepts directly.
+"""
+import io
+import wave
+
+import numpy as np
+
+from synthesis import DEFAULT_BLOCK_SIZE, SineWave
+
+
+PCM_MAX = 32767
+HEADROOM = 0.98  # keep normalized peaks (plus dither) clear of full scale
+
+
+def find_peak(blocks):
+    peak = 0.0
+    for block in blocks:
+        if len(block):
+            peak = max(peak, float(np.max(np.abs(block))))
+    return peak
+
+
+def write_wav(make_blocks, sample_rate, peak=None, dither=True, seed=None):
+    """
+    Encodes mono float blocks as a 16-bit WAV and returns the file contents as bytes.
+
+    make_blocks is called for each pass and must return a fresh iterable of float arrays; the
+    peak pass is skipped when peak is given. Blocks may be modified in place.
+    """
+    if peak is None:
+        peak = find_peak(make_blocks())
+    scale = HEADROOM * PCM_MAX / peak if peak > 0 else 0.0
+    rng = np.random.default_rng(seed)
+
+    output = io.BytesIO()
+    with wave.open(output, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        for block in make_blocks():
+            block = np.multiply(block, scale, out=block if block.flags.writeable else None)
+            if dither:
+                # Triangular dither of +-1 LSB decorrelates the quantization error from the signal
+                block += rng.random(len(block))
+                block -= rng.random(len(block))
+            np.rint(block, out=block)
+            np.clip(block, -PCM_MAX - 1, PCM_MAX, out=block)
+            wav_file.writeframes(block.astype('<i2').tobytes())
+    return output.getvalue()
+
+
+def render_waves_wav(waves, block_size=DEFAULT_BLOCK_SIZE, dither=True, seed=None):
+    """Streams SineWave.stream_combined(waves) into WAV bytes."""
+    return write_wav(
+        lambda: SineWave.stream_combined(waves, block_size),
+        waves[0].sample_rate,
+        dither=dither,
+        seed=seed,
+    )
@@ -0,0 +1,69 @@
+"""
+Cold-start budget check for the headless music_core package.
+
+Imports music_core in a fresh interpreter with -X importtime, fails if the package takes
+longer than the budget or drags in any UI / plotting modules.
+
+    python benchmarks/import_budget.py [--budget-ms 10]
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FORBIDDEN_MODULES = ('streamlit', 'matplotlib', 'numpy', 'pandas', 'scipy')
+DEFAULT_BUDGET_MS = 10.0
+
+
+def run_importtime(code):
+    """Runs code in a fresh interpreter under -X importtime; returns (self_us, cumulative_us, module) rows."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+    return rows
+
+
+def measure_import(module, runs=5):
+    """Best-of-N cumulative import time of module in microseconds, plus the top-level packages it loaded."""
+    best = None
+    loaded = set()
+    for _ in range(runs):
+        for _, cumulative_us, name in run_importtime(f'import {module}'):
+            name = name.strip()
+            loaded.add(name.split('.')[0])
+            if name == module:
+                best = cumulative_us if best is None else min(best, cumulative_us)
+    return best, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    cumulative_us, loaded = measure_import('music_core')
+    print(f"music_core cold import: {cumulative_us / 1000:.2f} ms (budget {args.budget_ms:.1f} ms)")
+
+    failures = []
+    if cumulative_us > args.budget_ms * 1000:
+        failures.append('import is over budget')
+    heavy = sorted(loaded.intersection(FORBIDDEN_MODULES))
+    if heavy:
+        failures.append(f"imports UI / plotting modules: {', '.join(heavy)}")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
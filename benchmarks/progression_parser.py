@@ -0,0 +1,79 @@
+"""
+Throughput check for the Roman-numeral progression parser.
+
+Checks a few known parses, then parses and transposes a batch of distinct random
+progressions into all 12 keys with cold caches and fails below the target rate.
+
+    python benchmarks/progression_parser.py [--count 5000] [--min-per-second 2000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from music_core.notes import chromatic_scale  # noqa: E402
+from music_core.progressions import parse_chord, parse_progression, realize_progression  # noqa: E402
+
+expected_types = {
+    'ii7': 'minor_7th',
+    'vm6': 'minor_6th',
+    'Imaj7': 'major_7th',
+    'V7': 'dominant_7th',
+    'viim7(b5)': 'half_diminished_7th',
+    'Iadd9': 'add9',
+    'bVII': 'major',
+    'IV/I': 'major',
+}
+
+numerals = ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII']
+suffixes = ['', '7', '6', 'maj7', 'add9', 'sus2', 'sus4', 'dim', 'aug', 'm7(b5)', 'P']
+
+
+def random_chord(rng):
+    numeral = rng.choice(numerals)
+    suffix = rng.choice(suffixes)
+    if suffix != 'maj7' and rng.random() < 0.5:
+        numeral = numeral.lower()
+    accidental = rng.choice(['', '', '', 'b', '#'])
+    bass = f"/{rng.choice(numerals)}" if rng.random() < 0.1 else ''
+    return f"{accidental}{numeral}{suffix}{bass}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=5000)
+    parser.add_argument('--min-per-second', type=float, default=2000.0)
+    args = parser.parse_args()
+
+    failures = [
+        f"{part}: {parse_chord(part).chord_type} != {chord_type}"
+        for part, chord_type in expected_types.items()
+        if parse_chord(part).chord_type != chord_type
+    ]
+
+    rng = random.Random(0)
+    progressions = list({'-'.join(random_chord(rng) for _ in range(rng.randint(3, 8))) for _ in range(args.count)})
+    for cache in (parse_chord, parse_progression, realize_progression):
+        cache.cache_clear()
+
+    start = time.perf_counter()
+    for progression in progressions:
+        for key in chromatic_scale:
+            realize_progression(key, progression)
+    elapsed = time.perf_counter() - start
+    rate = len(progressions) / elapsed
+    print(f"{len(progressions)} progressions parsed and transposed to 12 keys in {elapsed * 1000:.1f} ms "
+          f"({rate:.0f} per second, target {args.min_per_second:.0f})")
+
+    if rate < args.min_per_second:
+        failures.append('parser is under the target rate')
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
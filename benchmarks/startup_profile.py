@@ -0,0 +1,70 @@
+"""
+Startup import profile for app.py.
+
+app.py builds the page as soon as it is imported, so this replays only its module-level
+import statements in a fresh interpreter under -X importtime and prints the slowest top-level
+packages, best of N runs. Heavy packages that show up here are loaded on every cold start,
+before the first paint. The last recorded profile is checked in as startup_profile.txt;
+re-run and compare against it to spot regressions.
+
+    python benchmarks/startup_profile.py [--script app.py] [--top 15] [--runs 5]
+"""
+import argparse
+import ast
+import os
+import sys
+
+from import_budget import REPO_ROOT, run_importtime
+
+HEAVY_PACKAGES = ('matplotlib', 'numpy', 'pandas', 'scipy', 'PIL')
+
+
+def module_level_imports(script_path):
+    with open(script_path) as source:
+        tree = ast.parse(source.read(), filename=script_path)
+    statements = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return '\n'.join(ast.unparse(node) for node in statements)
+
+
+def profile(code, runs):
+    """Best-of-N cumulative time per top-level package (microseconds), the total, and every package loaded."""
+    best_packages = {}
+    best_total = None
+    loaded = set()
+    for _ in range(runs):
+        packages = {}
+        for _, cumulative_us, name in run_importtime(code):
+            loaded.add(name.strip().split('.')[0])
+            # Nested imports are indented by two spaces per level; keep only the top level
+            if name.startswith('  '):
+                continue
+            package = name.strip().split('.')[0]
+            packages[package] = packages.get(package, 0) + cumulative_us
+        total = sum(packages.values())
+        if best_total is None or total < best_total:
+            best_total, best_packages = total, packages
+    return best_packages, best_total, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--script', default='app.py')
+    parser.add_argument('--top', type=int, default=15)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    code = module_level_imports(os.path.join(REPO_ROOT, args.script))
+    packages, total, loaded = profile(code, args.runs)
+
+    print(f"{args.script} module-level imports: {total / 1000:.1f} ms")
+    for package, cumulative_us in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {package}")
+
+    eager = sorted(loaded.intersection(HEAVY_PACKAGES))
+    if eager:
+        print(f"Loaded eagerly: {', '.join(eager)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
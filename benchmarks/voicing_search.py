@@ -0,0 +1,67 @@
+"""
+Timing check for the voicing search.
+
+Searches every chord_intervals entry on all 12 roots across 24 frets with a cold cache,
+prints the per-chord average and fails if it is over the budget. Every voicing found is
+also re-checked against the constraints.
+
+    python benchmarks/voicing_search.py [--budget-ms 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from music_core.chords import chord_intervals  # noqa: E402
+from music_core.notes import chromatic_scale, note_index  # noqa: E402
+from music_core.pitch_masks import intervals_to_mask, pitch_classes_to_mask  # noqa: E402
+from music_core.voicings import DEFAULT_MAX_SPAN, _search_voicings, find_voicings, voicing_midi  # noqa: E402
+
+
+def check_voicing(voicing, root_note, chord_type):
+    """Returns a description of the first broken constraint, or None."""
+    midi = voicing_midi(voicing)
+    if pitch_classes_to_mask(midi) != intervals_to_mask(chord_intervals[chord_type], note_index[root_note]):
+        return 'does not cover exactly the chord tones'
+    if midi[0] % 12 != note_index[root_note]:
+        return 'root is not in the bass'
+    fretted = [fret for fret in voicing if fret]
+    if fretted and max(fretted) - min(fretted) > DEFAULT_MAX_SPAN:
+        return 'fret span too wide'
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--budget-ms', type=float, default=5.0)
+    args = parser.parse_args()
+
+    _search_voicings.cache_clear()
+    failures = []
+    total = 0
+    start = time.perf_counter()
+    for root_note in chromatic_scale:
+        for chord_type in chord_intervals:
+            voicings = find_voicings(root_note, chord_type)
+            total += len(voicings)
+            if not voicings:
+                failures.append(f"no voicing for {root_note} {chord_type}")
+            for voicing in voicings:
+                problem = check_voicing(voicing, root_note, chord_type)
+                if problem:
+                    failures.append(f"{root_note} {chord_type} {voicing}: {problem}")
+    # Checking is included, so this slightly overstates the search time
+    average_ms = (time.perf_counter() - start) * 1000 / (len(chromatic_scale) * len(chord_intervals))
+    print(f"{total} voicings, {average_ms:.2f} ms per chord (budget {args.budget_ms:.1f} ms)")
+
+    if average_ms > args.budget_ms:
+        failures.append('search is over budget')
+    for failure in failures[:20]:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
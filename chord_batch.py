@@ -0,0 +1,59 @@
+"""
+NumPy batch chord calculator.
+
+The full 12 roots x chord_intervals catalog is materialized once as contiguous arrays, so
+the UI and batch jobs can resolve many chords with a single fancy-indexing call instead of
+calling calculate_chord_notes in a loop. Rows are padded with -1 past each chord's size.
+"""
+import numpy as np
+
+from music_core.chords import chord_intervals
+from music_core.notes import chromatic_scale, degree_names
+
+
+chord_type_names = list(chord_intervals.keys())
+chord_type_ids = {chord_type: i for i, chord_type in enumerate(chord_type_names)}
+max_chord_size = max(len(intervals) for intervals in chord_intervals.values())
+
+# (chord type, chord tone) -> semitones above the root
+interval_catalog = np.full((len(chord_type_names), max_chord_size), -1, dtype=np.int16)
+for type_id, chord_type in enumerate(chord_type_names):
+    interval_catalog[type_id, :len(chord_intervals[chord_type])] = chord_intervals[chord_type]
+
+chord_sizes = (interval_catalog >= 0).sum(axis=1)
+
+# (root, chord type, chord tone) -> pitch class
+chord_catalog = np.where(
+    interval_catalog >= 0,
+    (np.arange(12, dtype=np.int16)[:, None, None] + interval_catalog[None, :, :]) % 12,
+    -1,
+).astype(np.int8)
+chord_catalog = np.ascontiguousarray(chord_catalog)
+
+# Lookup tables for turning the numeric matrices back into the app's labels
+note_name_table = np.array(chromatic_scale + [''], dtype=object)  # index -1 -> ''
+degree_label_table = np.array(
+    [degree_names.get(interval, '?') for interval in range(interval_catalog.max() + 1)] + [''],
+    dtype=object,
+)
+
+for _table in (interval_catalog, chord_sizes, chord_catalog, note_name_table, degree_label_table):
+    _table.setflags(write=False)
+
+
+def batch_chord_notes(root_indices, type_ids):
+    """Returns (pitch_classes, intervals) matrices of shape (n_chords, max_chord_size)."""
+    root_indices = np.asarray(root_indices, dtype=np.intp) % 12
+    type_ids = np.asarray(type_ids, dtype=np.intp)
+    return chord_catalog[root_indices, type_ids], interval_catalog[type_ids]
+
+
+def batch_chord_names(pitch_classes, intervals):
+    """Converts batch matrices into per-chord (notes, degrees) lists like calculate_chord_notes."""
+    note_rows = note_name_table[pitch_classes]
+    degree_rows = degree_label_table[intervals]
+    sizes = (np.asarray(intervals) >= 0).sum(axis=1)
+    return [
+        (list(notes[:size]), list(degrees[:size]))
+        for notes, degrees, size in zip(note_rows, degree_rows, sizes)
+    ]
@@ -0,0 +1,77 @@
+"""
+Reverse chord lookup for the fretboard selector.
+
+Built once at import like scale_index. Every chord_intervals entry is rotated onto all 12
+roots and its pitch-class mask maps to the (root, chord type) pairs that spell it, so naming
+a set of notes is a dictionary lookup however many chord types there are. The bass note
+decides the inversion. When the bass isn't a chord tone, the notes above it are looked up
+again as a slash chord.
+"""
+from collections import namedtuple
+
+from music_core.chords import chord_intervals, chord_symbols
+from music_core.notes import chromatic_scale, note_index
+from music_core.pitch_masks import intervals_to_mask
+
+
+ChordMatch = namedtuple('ChordMatch', ['root', 'chord_type', 'bass', 'inversion', 'name'])
+
+chord_type_order = {chord_type: position for position, chord_type in enumerate(chord_intervals)}
+
+
+def _build_chord_index():
+    index = {}
+    for chord_type, intervals in chord_intervals.items():
+        for root in chromatic_scale:
+            index.setdefault(intervals_to_mask(intervals, note_index[root]), []).append((root, chord_type))
+    return {mask: tuple(chords) for mask, chords in index.items()}
+
+
+chord_index = _build_chord_index()
+
+
+def chord_name(root, chord_type, bass=None):
+    name = f"{root}{chord_symbols.get(chord_type, chord_type)}"
+    return f"{name}/{bass}" if bass and bass != root else name
+
+
+def _inversion(root, chord_type, bass):
+    """0 for root position, n for the chord tone at position n in the bass, None if the bass isn't a chord tone."""
+    bass_interval = (note_index[bass] - note_index[root]) % 12
+    for position, interval in enumerate(chord_intervals[chord_type]):
+        if interval % 12 == bass_interval:
+            return position
+    return None
+
+
+def identify_chords(selected_notes, bass=None):
+    """Every chord spelled by the selected notes; bass defaults to the first note selected.
+
+    Root-position matches come first, then inversions, then slash chords over a non-chord bass.
+    """
+    if not selected_notes:
+        return []
+    bass = bass or selected_notes[0]
+    mask = 0
+    for note in selected_notes:
+        mask |= 1 << note_index[note]
+
+    matches = [
+        ChordMatch(root, chord_type, bass, _inversion(root, chord_type, bass), chord_name(root, chord_type, bass))
+        for root, chord_type in chord_index.get(mask, ())
+    ]
+    # The notes above the bass might spell a chord on their own (e.g. D/C)
+    upper_mask = mask & ~(1 << note_index[bass])
+    matches += [
+        ChordMatch(root, chord_type, bass, None, chord_name(root, chord_type, bass))
+        for root, chord_type in chord_index.get(upper_mask, ())
+        if _inversion(root, chord_type, bass) is None
+    ]
+
+    def rank(match):
+        if match.inversion is None:
+            return 2, chord_type_order[match.chord_type]
+        return min(match.inversion, 1), chord_type_order[match.chord_type]
+
+    matches.sort(key=rank)
+    return matches
@@ -0,0 +1,195 @@
+"""
+Chord recognition for uploaded recordings.
+
+The memory-mapped WAV is walked in batches of Hann-windowed STFT frames. Each batch's
+magnitude spectrum is folded into a 12-bin chromagram, plus a bass chromagram of the lowest
+octaves weighted towards the lowest note, with precomputed bin-to-pitch-class matrices.
+
+Chord types that spell the same pitch classes (Am7 / C6, the dim7 and aug rotations) share one
+state, and each state's template includes the first few harmonics of every chord tone, so
+bright saw or square tones don't read as sevenths or add9s. All states are scored with a single
+matrix multiply, with a small prior favouring plain triads. A Viterbi pass with a sticky
+self-transition then smooths the frame scores into segments. Each segment is named with the
+chord_symbols spelling whose root matches the segment's bass note, preferring the earlier
+chord_intervals entry when no root does.
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import fft
+
+from chord_batch import chord_catalog, chord_type_names
+from music_core.chords import chord_symbols
+from music_core.notes import chromatic_scale
+from pitch_detection import to_float_samples
+
+
+FRAME_SIZE = 8192
+HOP_SIZE = 4096
+FRAMES_PER_BATCH = 128
+MIN_FREQUENCY, MAX_FREQUENCY = 55.0, 2000.0
+BASS_MIN_FREQUENCY, BASS_MAX_FREQUENCY = 38.0, 200.0
+C0_FREQUENCY = 16.351597831287414
+TEMPLATE_HARMONICS = 5
+HARMONIC_DECAY = 0.6  # template weight of harmonic h is HARMONIC_DECAY ** (h - 1)
+STAY_PROBABILITY = 0.95
+EMISSION_SHARPNESS = 20.0  # how strongly template similarity separates the states
+NO_CHORD_SCORE = 0.55  # similarity the "no chord" state always gets
+SILENCE_RMS = 0.005
+NO_CHORD_LABEL = 'N.C.'
+
+# Added to the template similarity; richer chords must fit clearly better than the triad inside them
+type_priors = {
+    'major': 0.0,
+    'minor': 0.0,
+    'power': -0.04,
+    'diminished': -0.02,
+    'augmented': -0.03,
+    'suspended_2nd': -0.02,
+    'suspended_4th': -0.02,
+}
+DEFAULT_TYPE_PRIOR = -0.015  # sevenths, sixths and add9s
+
+ChordSegment = namedtuple('ChordSegment', ['start', 'end', 'label'])
+
+
+@lru_cache(maxsize=8)
+def chroma_matrix(sample_rate, frame_size, min_frequency=MIN_FREQUENCY, max_frequency=MAX_FREQUENCY):
+    """(n_bins, 12) matrix folding FFT bins between min_frequency and max_frequency onto pitch classes."""
+    bin_frequencies = fft.rfftfreq(frame_size, 1 / sample_rate)
+    in_range = (bin_frequencies >= min_frequency) & (bin_frequencies <= max_frequency)
+    pitch_classes = np.round(12 * np.log2(np.where(in_range, bin_frequencies, 1) / C0_FREQUENCY)).astype(int) % 12
+    matrix = np.zeros((len(bin_frequencies), 12), dtype=np.float32)
+    matrix[np.nonzero(in_range)[0], pitch_classes[in_range]] = 1
+    matrix.setflags(write=False)
+    return matrix
+
+
+@lru_cache(maxsize=8)
+def bass_chroma_matrix(sample_rate, frame_size):
+    """chroma_matrix over the bass range, weighted by 1 / f**2 so the lowest sounding note dominates."""
+    bin_frequencies = fft.rfftfreq(frame_size, 1 / sample_rate)
+    weights = (BASS_MIN_FREQUENCY / np.maximum(bin_frequencies, BASS_MIN_FREQUENCY)) ** 2
+    matrix = chroma_matrix(sample_rate, frame_size, BASS_MIN_FREQUENCY, BASS_MAX_FREQUENCY) * weights[:, None]
+    matrix.setflags(write=False)
+    return matrix
+
+
+def _harmonic_template(pitch_classes):
+    """Unit-length chroma of the chord tones and their first TEMPLATE_HARMONICS harmonics."""
+    template = np.zeros(12)
+    for harmonic in range(1, TEMPLATE_HARMONICS + 1):
+        shift = int(round(12 * np.log2(harmonic)))
+        for pitch_class in pitch_classes:
+            template[(pitch_class + shift) % 12] += HARMONIC_DECAY ** (harmonic - 1)
+    return template / np.linalg.norm(template)
+
+
+def _build_states():
+    """One state per distinct pitch-class set in the catalog, in chord_intervals order, then 'no chord'.
+
+    Returns (templates, priors, spellings) where spellings[state] lists the (root index, chord type)
+    pairs that spell it, earliest chord type first.
+    """
+    spellings = {}
+    for type_id, chord_type in enumerate(chord_type_names):
+        for root in range(12):
+            pitch_classes = chord_catalog[root, type_id]
+            pitch_classes = frozenset(int(pc) for pc in pitch_classes[pitch_classes >= 0])
+            spellings.setdefault(pitch_classes, []).append((root, chord_type))
+
+    templates = np.array([_harmonic_template(pitch_classes) for pitch_classes in spellings], dtype=np.float32)
+    priors = np.array(
+        [max(type_priors.get(chord_type, DEFAULT_TYPE_PRIOR) for _, chord_type in spelling) for spelling in spellings.values()]
+        + [0.0],
+        dtype=np.float32,
+    )
+    return templates, priors, list(spellings.values())
+
+
+chord_templates, state_priors, state_spellings = _build_states()
+NO_CHORD_STATE = len(state_spellings)
+
+
+def state_label(state, bass_pitch_class=None):
+    """Chord name for a state; among identical pitch-class sets the spelling rooted on the bass wins."""
+    if state == NO_CHORD_STATE:
+        return NO_CHORD_LABEL
+    spellings = state_spellings[state]
+    root, chord_type = next((spelling for spelling in spellings if spelling[0] == bass_pitch_class), spellings[0])
+    return f"{chromatic_scale[root]}{chord_symbols[chord_type]}"
+
+
+def iter_chord_scores(sample_rate, samples, frame_size=FRAME_SIZE, hop_size=HOP_SIZE):
+    """Yields (frame start time, scores, bass chroma) batches; scores has one column per state."""
+    window = np.hanning(frame_size).astype(np.float32)
+    folding = chroma_matrix(sample_rate, frame_size)
+    bass_folding = bass_chroma_matrix(sample_rate, frame_size)
+    span = hop_size * (FRAMES_PER_BATCH - 1) + frame_size
+    for batch_start in range(0, max(len(samples) - frame_size + 1, 0), hop_size * FRAMES_PER_BATCH):
+        chunk = to_float_samples(samples[batch_start:batch_start + span])
+        if chunk.ndim > 1:
+            chunk = chunk.mean(axis=1)
+        frames = sliding_window_view(chunk, frame_size)[::hop_size]
+        magnitudes = np.abs(fft.rfft(frames * window, axis=1)).astype(np.float32)
+        chroma = magnitudes @ folding
+        chroma /= np.maximum(np.linalg.norm(chroma, axis=1, keepdims=True), 1e-9)
+
+        scores = np.empty((len(frames), len(state_priors)), dtype=np.float32)
+        scores[:, :-1] = chroma @ chord_templates.T  # every chord state in one multiply
+        scores[:, -1] = NO_CHORD_SCORE
+        scores += state_priors
+        silent = np.sqrt(np.mean(frames ** 2, axis=1)) < SILENCE_RMS
+        scores[silent, :-1] = 0
+        yield batch_start / sample_rate, scores, magnitudes @ bass_folding
+
+
+def recognize_chords(sample_rate, samples, frame_size=FRAME_SIZE, hop_size=HOP_SIZE):
+    """Viterbi-smoothed chord timeline as a list of ChordSegments."""
+    n_states = len(state_priors)
+    log_stay = np.log(STAY_PROBABILITY)
+    log_switch = np.log((1 - STAY_PROBABILITY) / (n_states - 1))
+    states = np.arange(n_states)
+
+    delta = None
+    backpointers = []  # one int16 row per frame
+    bass_chroma = []  # one (frames, 12) block per batch
+    for _, scores, bass in iter_chord_scores(sample_rate, samples, frame_size, hop_size):
+        bass_chroma.append(bass)
+        emissions = EMISSION_SHARPNESS * scores
+        for emission in emissions:
+            if delta is None:
+                delta = emission.astype(np.float64)
+                backpointers.append(states.astype(np.int16))
+                continue
+            # Transitions are uniform off the diagonal, so the best switch is just the best previous state
+            best_previous = int(delta.argmax())
+            stay = delta + log_stay
+            switch = delta[best_previous] + log_switch
+            keep = stay >= switch
+            backpointers.append(np.where(keep, states, best_previous).astype(np.int16))
+            delta = np.where(keep, stay, switch) + emission
+
+    if delta is None:
+        return []
+
+    path = np.empty(len(backpointers), dtype=np.int16)
+    path[-1] = delta.argmax()
+    for frame in range(len(backpointers) - 1, 0, -1):
+        path[frame - 1] = backpointers[frame][path[frame]]
+    bass_chroma = np.concatenate(bass_chroma)
+
+    segments = []
+    change_points = np.flatnonzero(np.diff(path)) + 1
+    starts = np.concatenate(([0], change_points))
+    ends = np.concatenate((change_points, [len(path)]))
+    for start, end in zip(starts, ends):
+        bass_pitch_class = int(bass_chroma[start:end].sum(axis=0).argmax())
+        segments.append(ChordSegment(
+            start * hop_size / sample_rate,
+            ((end - 1) * hop_size + frame_size) / sample_rate,
+            state_label(int(path[start]), bass_pitch_class),
+        ))
+    return segments
@@ -1,62 +1,103 @@
-import matplotlib.pyplot as plt
+from html import escape
+
 import numpy as np
 import streamlit as st
 from matplotlib.font_manager import FontProperties
+from matplotlib.patches import Circle
 
+from figure_manager import figure_manager
 from note_sets import circle_of_fifths_notes
+from render_cache import RenderCache
 
 
-# Assuming circle_of_fifths_notes and other necessary variables are defined outside this function
-def draw_circle_of_fifths(root, chord_notes, chord_degrees):
-    fig, ax = plt.subplots(figsize=(8, 8))
-    circle_radius = 1.1  # Increase the radius slightly to spread out the notes
-    circle = plt.Circle((0, 0), circle_radius, color='lightgray', linewidth=2, fill=False)
-    ax.add_artist(circle)
+circle_radius = 1.1  # Increase the radius slightly to spread out the notes
+text_radius = 1.15  # Slightly larger radius for text placement
 
-    font = FontProperties(family='Times New Roman', style='normal', size=14)
+# Note positions for every root: the root sits at the top and the circle turns 30 degrees per step.
+# circle_x[root_index, i] / circle_y[root_index, i] place circle_of_fifths_notes[i].
+_steps = np.arange(12)
+_angles = np.deg2rad((_steps[None, :] - _steps[:, None]) * 30 + 90)
+circle_x = np.cos(_angles) * text_radius
+circle_y = np.sin(_angles) * text_radius
 
-    # Assuming circle_of_fifths_notes is a list that contains your circle of fifths notes
-    try:
-        root_index = circle_of_fifths_notes.index(root)
-    except ValueError:
-        # This will handle cases where the root note is an enharmonic equivalent not directly listed in circle_of_fifths_notes
-        for i, note in enumerate(circle_of_fifths_notes):
-            if root in note.split('/'):
-                root_index = i
-                break
+circle_render_cache = RenderCache(maxsize=64)
 
-    rotation = (root_index * -30) % 360
 
-    text_radius = 1.15  # Slightly larger radius for text placement
+def _circle_root_index(root):
+    if root in circle_of_fifths_notes:
+        return circle_of_fifths_notes.index(root)
+    # This will handle cases where the root note is an enharmonic equivalent not directly listed in circle_of_fifths_notes
+    for i, note in enumerate(circle_of_fifths_notes):
+        if root in note.split('/'):
+            return i
+    return 0
 
-    for i, circle_note in enumerate(circle_of_fifths_notes):
-        angle = np.deg2rad((i * 30) + rotation + 90)
-        x, y = np.cos(angle) * text_radius, np.sin(angle) * text_radius
 
+def _circle_labels(chord_notes, chord_degrees):
+    """Pairs each circle note with its chord degree, or None when it isn't in the chord."""
+    labels = []
+    for circle_note in circle_of_fifths_notes:
         # Splitting the circle note if it contains a '/'
         split_notes = circle_note.split('/')
-        matched_note = None
-
-        # Check if any of the split notes or the whole note is in chord_notes
-        for chord_note in chord_notes:
+        note_degree = None
+        for chord_note, degree in zip(chord_notes, chord_degrees):
             if chord_note in split_notes or chord_note == circle_note:
-                matched_note = chord_note
+                note_degree = degree
                 break
-
-        if matched_note:
-            note_degree = chord_degrees[chord_notes.index(matched_note)]
-            note_text = f"{circle_note}$_{{{note_degree}}}$"  # Using LaTeX for subscript with degree
-            ax.text(x, y, note_text, ha='center', va='center', fontproperties=font, weight='bold', fontsize=16, color='blue')
+        labels.append((circle_note, note_degree))
+    return labels
+
+
+def render_circle_png(root, chord_notes, chord_degrees):
+    with figure_manager.figure((8, 8)) as fig:
+        ax = fig.add_subplot()
+        ax.add_artist(Circle((0, 0), circle_radius, color='lightgray', linewidth=2, fill=False))
+
+        font = FontProperties(family='Times New Roman', style='normal', size=14)
+
+        root_index = _circle_root_index(root)
+        for x, y, (circle_note, note_degree) in zip(circle_x[root_index], circle_y[root_index], _circle_labels(chord_notes, chord_degrees)):
+            if note_degree is not None:
+                note_text = f"{circle_note}$_{{{note_degree}}}$"  # Using LaTeX for subscript with degree
+                ax.text(x, y, note_text, ha='center', va='center', fontproperties=font, weight='bold', fontsize=16, color='blue')
+            else:
+                ax.text(x, y, circle_note, ha='center', va='center', fontproperties=font, color='black')
+
+        ax.set_xlim(-1.2, 1.2)
+        ax.set_ylim(-1.2, 1.2)
+        ax.axis('off')
+
+        return figure_manager.export_png(fig, dpi=200, bbox_inches='tight')
+
+
+def render_circle_svg(root, chord_notes, chord_degrees):
+    scale = 100  # user units per data unit; the plot spans -1.3..1.3
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{-1.3 * scale:.0f} {-1.3 * scale:.0f} {2.6 * scale:.0f} {2.6 * scale:.0f}" '
+        f'width="100%" style="max-width:640px;background:#fff" font-family="Times New Roman, Times, serif">',
+        f'<circle cx="0" cy="0" r="{circle_radius * scale:.1f}" fill="none" stroke="lightgray" stroke-width="2"/>',
+    ]
+    root_index = _circle_root_index(root)
+    for x, y, (circle_note, note_degree) in zip(circle_x[root_index], circle_y[root_index], _circle_labels(chord_notes, chord_degrees)):
+        position = f'x="{x * scale:.1f}" y="{-y * scale:.1f}" text-anchor="middle" dominant-baseline="central"'
+        if note_degree is not None:
+            parts.append(
+                f'<text {position} font-size="9" font-weight="bold" fill="blue">{escape(circle_note)}'
+                f'<tspan baseline-shift="sub" font-size="6">{escape(note_degree)}</tspan></text>'
+            )
         else:
-            ax.text(x, y, circle_note, ha='center', va='center', fontproperties=font, color='black')
-
-    ax.set_xlim(-1.2, 1.2)
-    ax.set_ylim(-1.2, 1.2)
-    ax.axis('off')
-
-    plt.show()
-
+            parts.append(f'<text {position} font-size="8" fill="black">{escape(circle_note)}</text>')
+    parts.append('</svg>')
+    return ''.join(parts)
 
-    st.pyplot(fig)
 
+def draw_circle_of_fifths(root, chord_notes, chord_degrees, output='png'):
+    """Shows the circle of fifths for a chord; output is 'png' (matplotlib) or 'svg' (inline markup)."""
+    cache_key = (output, root, tuple(chord_notes), tuple(chord_degrees))
+    if output == 'svg':
+        svg = circle_render_cache.get_or_render(cache_key, lambda: render_circle_svg(root, chord_notes, chord_degrees))
+        st.markdown(svg, unsafe_allow_html=True)
+        return
 
+    png = circle_render_cache.get_or_render(cache_key, lambda: render_circle_png(root, chord_notes, chord_degrees))
+    st.image(png, width='stretch')
@@ -0,0 +1,36 @@
+"""
+Peak-preserving decimation for waveform plots.
+
+Splits the signal into equal buckets and keeps each bucket's minimum and maximum sample, in
+time order, so the drawn envelope still reaches every peak while the point count stays
+constant however long the signal is.
+"""
+import numpy as np
+
+
+DEFAULT_MAX_POINTS = 4000
+
+
+def minmax_decimate(signal, max_points=DEFAULT_MAX_POINTS):
+    """Returns (sample indices, values) with at most about max_points points covering the whole signal."""
+    signal = np.asarray(signal)
+    count = len(signal)
+    if count <= max_points:
+        return np.arange(count), signal
+
+    n_buckets = max_points // 2
+    bucket_size = count // n_buckets
+    usable = n_buckets * bucket_size
+    buckets = signal[:usable].reshape(n_buckets, bucket_size)
+
+    offsets = np.arange(n_buckets) * bucket_size
+    low = buckets.argmin(axis=1) + offsets
+    high = buckets.argmax(axis=1) + offsets
+    # Emit each bucket's two extremes in the order they occur
+    indices = np.column_stack((np.minimum(low, high), np.maximum(low, high))).ravel()
+
+    if usable < count:
+        tail = signal[usable:]
+        tail_indices = np.array(sorted({usable + int(tail.argmin()), usable + int(tail.argmax())}))
+        indices = np.concatenate((indices, tail_indices))
+    return indices, signal[indices]
@@ -0,0 +1,85 @@
+"""
+Shared matplotlib figure lifecycle.
+
+Figures are created on a plain Agg canvas instead of through pyplot, so they never land in
+pyplot's global registry, and the pooled ones are cleared and handed back after export
+instead of piling up for the life of the server process.
+"""
+import io
+import os
+import sys
+from collections import defaultdict
+from contextlib import contextmanager
+from threading import Lock
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+def _current_rss_bytes():
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+        # Peak rather than current, but the best portable number; macOS reports bytes, Linux KB
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        return None
+
+
+class FigureManager:
+    def __init__(self, max_pooled_per_size=4):
+        self.max_pooled_per_size = max_pooled_per_size
+        self.created = 0
+        self.in_use = 0
+        self._pool = defaultdict(list)
+        self._lock = Lock()
+
+    def new_figure(self, figsize, dpi=100):
+        """Creates a figure with its own Agg canvas; the caller owns it (e.g. a cached background layer)."""
+        fig = Figure(figsize=figsize, dpi=dpi)
+        FigureCanvasAgg(fig)
+        with self._lock:
+            self.created += 1
+        return fig
+
+    @contextmanager
+    def figure(self, figsize, dpi=100):
+        """Borrows an empty figure of the given size, returning it to the pool when the block exits."""
+        key = (tuple(figsize), dpi)
+        with self._lock:
+            fig = self._pool[key].pop() if self._pool[key] else None
+            self.in_use += 1
+        if fig is None:
+            fig = self.new_figure(figsize, dpi)
+        try:
+            yield fig
+        finally:
+            fig.clear()
+            with self._lock:
+                self.in_use -= 1
+                if len(self._pool[key]) < self.max_pooled_per_size:
+                    self._pool[key].append(fig)
+
+    @staticmethod
+    def export_png(fig, **savefig_kwargs):
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', **savefig_kwargs)
+        return buffer.getvalue()
+
+    def stats(self):
+        with self._lock:
+            pooled = sum(len(figures) for figures in self._pool.values())
+            stats = {'created': self.created, 'in_use': self.in_use, 'pooled': pooled}
+        # Only look at pyplot if something already imported it
+        pyplot = sys.modules.get('matplotlib.pyplot')
+        stats['pyplot_open'] = len(pyplot.get_fignums()) if pyplot else 0
+        stats['rss_bytes'] = _current_rss_bytes()
+        return stats
+
+
+figure_manager = FigureManager()
@@ -1,23 +1,14 @@
 import streamlit as st
 from chords import calculate_chord_notes
+import scale_index
+from scale_index import finder_mode_intervals
+from chord_index import identify_chords
 
 st.set_page_config(layout="wide")
 
 def fretboard_select():
-    # Define the chromatic scale and mode intervals
+    # Define the chromatic scale
     chromatic_scale = ['C', 'C#/Db', 'D', 'D#/Eb', 'E', 'F', 'F#/Gb', 'G', 'G#/Ab', 'A', 'A#/Bb', 'B']
-    mode_intervals = {
-        'Ionian': [0, 2, 4, 5, 7, 9, 11],
-        'Dorian': [0, 2, 3, 5, 7, 9, 10],
-        'Phrygian': [0, 1, 3, 5, 7, 8, 10],
-        'Lydian': [0, 2, 4, 6, 7, 9, 11],
-        'Mixolydian': [0, 2, 4, 5, 7, 9, 10],
-        'Aeolian': [0, 2, 3, 5, 7, 8, 10],
-        'Locrian': [0, 1, 3, 5, 6, 8, 10],
-        'Harmonic Minor': [0, 2, 3, 5, 7, 8, 11],
-        'Phrygian Dominant': [0, 1, 4, 5, 7, 8, 10]
-    }
-
     # Guitar strings dictionary
     guitar_strings_standard = {
         'E_low': ['E', 'F', 'F#/Gb', 'G', 'G#/Ab', 'A', 'A#/Bb', 'B', 'C', 'C#/Db', 'D', 'D#/Eb', 'E'],
@@ -28,26 +19,9 @@ def fretboard_select():
         'E_high': ['E', 'F', 'F#/Gb', 'G', 'G#/Ab', 'A', 'A#/Bb', 'B', 'C', 'C#/Db', 'D', 'D#/Eb', 'E']
     }
 
-    # Function to generate all modes for every note in the chromatic scale
-    def generate_all_modes_scales():
-        all_modes_scales = {}
-        for note in chromatic_scale:
-            all_modes_scales[note] = {}
-            for mode_name, intervals in mode_intervals.items():
-                scale_notes = [chromatic_scale[(chromatic_scale.index(note) + interval) % 12] for interval in intervals]
-                all_modes_scales[note][mode_name] = scale_notes
-        return all_modes_scales
-
-    all_modes_scales = generate_all_modes_scales()
-
-    # Function to find scales that contain the selected notes
+    # Function to find scales that contain the selected notes (one lookup in the shared scale_index)
     def find_scales_for_notes(selected_notes):
-        matching_scales = []
-        for root_note, modes in all_modes_scales.items():
-            for mode_name, scale_notes in modes.items():
-                if all(note in scale_notes for note in selected_notes):
-                    matching_scales.append(f"{root_note} {mode_name}")
-        return matching_scales
+        return [f"{root_note} {mode_name}" for root_note, mode_name in scale_index.find_scales_for_notes(selected_notes)]
 
 
     # Function to calculate notes and degrees for a mode
@@ -55,7 +29,7 @@ def fretboard_select():
         root_index = chromatic_scale.index(root_note)
         if descending and "Melodic Minor" in mode_name:
             mode_name = "Melodic Minor Descending"
-        intervals = mode_intervals[mode_name]
+        intervals = finder_mode_intervals[mode_name]
         mode_notes = []
         degrees = []
         for interval in intervals:
@@ -211,6 +185,20 @@ def fretboard_select():
         else:
             st.markdown("<div class='scale-card'><p class='scale-name'>No scales match the selected notes.</p></div>", unsafe_allow_html=True)
 
+    if st.button("Identify Chords for Selected Notes", key="identify_chords_for_selected_notes"):
+        # The first note clicked is treated as the bass
+        matching_chords = identify_chords(st.session_state['selected_notes'])
+        if matching_chords:
+            inversion_names = {0: 'root position', 1: '1st inversion', 2: '2nd inversion', 3: '3rd inversion'}
+            formatted_chords = "<div class='scale-card'><p class='scale-name'>Matching chords:</p>"
+            for match in matching_chords:
+                detail = 'slash chord' if match.inversion is None else inversion_names.get(match.inversion, f"inversion {match.inversion}")
+                formatted_chords += f"<div class='scale-name'>{match.name} <small>({detail})</small></div>"
+            formatted_chords += "</div>"
+            st.markdown(formatted_chords, unsafe_allow_html=True)
+        else:
+            st.markdown("<div class='scale-card'><p class='scale-name'>No chords match the selected notes.</p></div>", unsafe_allow_html=True)
+
     # Button to find scales for notes in history
     if st.button("Find Scales for History Notes", key="find_scales_for_history_notes"):
         all_notes_history = [note for notes_set in st.session_state['notes_history'] for note in notes_set]
@@ -1,26 +1,17 @@
-import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-
-st.set_page_config(layout="wide")
+import streamlit as st
 
-class SineWave:
-    def __init__(self, frequency, amplitude=1.0, phase=0.0, sample_rate=44100, duration=1):
-        self.frequency = frequency
-        self.amplitude = amplitude
-        self.phase = phase
-        self.sample_rate = sample_rate
-        self.duration = duration
-        self.time = np.arange(0, self.duration, 1 / self.sample_rate)
-        self.wave = self.generate_wave()
+from audio_export import render_waves_wav, write_wav
+from downsample import minmax_decimate
+from figure_manager import figure_manager
+from music_core.tuning import DEFAULT_A4, fretboard_frequencies, fretboard_midi, midi_to_note, tunings
+from spectrum import beat_frequencies, compute_spectrum
+from synthesis import SineWave
+from timbre import TIMBRES, render_chord
 
-    def generate_wave(self):
-        return self.amplitude * np.sin(2 * np.pi * self.frequency * self.time + self.phase)
+st.set_page_config(layout="wide")
 
-    @staticmethod
-    def combine_waves(waves):
-        combined_wave = np.sum([wave.wave for wave in waves], axis=0)
-        return combined_wave
+FRET_COUNT = 13
 
 def update_selected_notes_display(graph_placeholders):
     # Function to update the graphs based on selected notes
@@ -31,9 +22,9 @@ def update_selected_notes_display(graph_placeholders):
     selected_notes_list = []  # List to hold selected notes for printing
 
     for idx, note_info in enumerate(st.session_state['selected_notes']):
-        frequency = float(note_info['frequency'].split('(')[1].split(' ')[0])
+        frequency = note_info['frequency']
         display_note = st.checkbox(
-            f"Display Note {idx + 1}: {note_info['note']} ({note_info['frequency']}) - String: {note_info['string']}, Fret: {note_info['fret']}",
+            f"Display Note {idx + 1}: {note_info['note']} ({frequency:.2f} Hz) - String: {note_info['string']}, Fret: {note_info['fret']}",
             value=True,
             key=f"checkbox_{idx}"
         )
@@ -42,7 +33,7 @@ def update_selected_notes_display(graph_placeholders):
             selected_notes_list.append(frequency)
 
     # Convert the list of frequencies to string representation
-    selected_notes_str = str(selected_notes_list)
+    selected_notes_str = str([round(frequency, 2) for frequency in selected_notes_list])
 
     # Update a text element with the string representation of the list
     st.text("Selected Frequencies:")
@@ -54,26 +45,65 @@ def update_selected_notes_display(graph_placeholders):
             waves = [SineWave(freq) for freq in frequencies]
             combined_wave = SineWave.combine_waves(waves)
 
-            fig, ax = plt.subplots()
-            ax.plot(waves[0].time[:1000], combined_wave[:1000])
-            ax.set_title('Combined Sine Waves')
-            ax.set_xlabel('Time')
-            ax.set_ylabel('Amplitude')
+            # Reduce the size of the graph by 30% (matplotlib's default is 6.4 x 4.8 inches)
+            with figure_manager.figure((6.4 * 0.7, 4.8 * 0.7)) as fig:
+                ax = fig.add_subplot()
+                # Min/max envelope of the whole signal instead of only the first 1000 samples
+                sample_indices, envelope = minmax_decimate(combined_wave)
+                ax.plot(sample_indices / waves[0].sample_rate, envelope, lw=0.5)
+                ax.set_title('Combined Sine Waves')
+                ax.set_xlabel('Time')
+                ax.set_ylabel('Amplitude')
+                png = figure_manager.export_png(fig, dpi=200, bbox_inches='tight')
+            graph_placeholders[0][1].image(png, width='stretch')
+
+    if frequencies and st.checkbox("Show Spectrum and Beat Frequencies", key="show_spectrum"):
+        show_spectrum_panel(frequencies)
+
+    # Render the combined wave as 16-bit audio and play it in the browser
+    duration = st.number_input("Audio duration (seconds)", min_value=0.5, max_value=60.0, value=2.0, step=0.5, key="audio_duration")
+    timbre = st.selectbox("Timbre", list(TIMBRES), key="audio_timbre")
+    if st.button("Render Audio"):
+        if frequencies:
+            if timbre == 'sine':
+                # Plain sines stream straight from the oscillator, block by block
+                waves = [SineWave(freq, duration=duration) for freq in frequencies]
+                st.audio(render_waves_wav(waves), format='audio/wav')
+            else:
+                mix = render_chord(frequencies, duration, timbre, dtype=np.float32)
+                st.audio(write_wav(lambda: [mix], 44100), format='audio/wav')
 
-            # Reduce the size of the graph by 30%
-            fig.set_size_inches(fig.get_size_inches() * 0.7)
-            graph_placeholders[0][1].pyplot(fig)
 
 
 
+def show_spectrum_panel(frequencies):
+    """Plots the spectrum of the combined notes and lists the beat frequency of every note pair."""
+    bin_frequencies, magnitudes = compute_spectrum(frequencies)
+    visible = bin_frequencies <= max(frequencies) * 1.5
+
+    with figure_manager.figure((6.4 * 0.7, 4.8 * 0.7)) as fig:
+        ax = fig.add_subplot()
+        ax.plot(bin_frequencies[visible], magnitudes[visible])
+        ax.set_title('Spectrum')
+        ax.set_xlabel('Frequency (Hz)')
+        ax.set_ylabel('Magnitude')
+        png = figure_manager.export_png(fig, dpi=200, bbox_inches='tight')
+    st.image(png, width='stretch')
+
+    beats = beat_frequencies(frequencies)
+    if beats:
+        st.table([
+            {'Note A (Hz)': round(low, 2), 'Note B (Hz)': round(high, 2), 'Beat (Hz)': round(beat, 2)}
+            for low, high, beat in beats
+        ])
+
 
 def display_history():
     st.write("History of Chords:")
     for chord_index, chord in enumerate(st.session_state['notes_history'], start=1):
         # Gather the notes and frets as before
         notes = [note['note'] for note in chord]
-        # Extract the frequency numbers, convert to float, and remove " Hz"
-        frequencies = [float(note['frequency'].split(' ')[0][1:]) for note in chord]
+        frequencies = [round(note['frequency'], 2) for note in chord]
         frets = [f"String: {note['string']}, Fret: {note['fret']}" for note in chord]
         
         # Format the details into a compact representation
@@ -81,6 +111,8 @@ def display_history():
         
         # Display the formatted chord details
         st.code(chord_details, language='python')
+        if st.checkbox(f"Analyze chord {chord_index}", key=f"analyze_history_{chord_index}"):
+            show_spectrum_panel([note['frequency'] for note in chord])
 
 
 def main():
@@ -108,17 +140,12 @@ def main():
 
         
 def fretboard_select():
-    guitar_string_frequencies = {
-        'strings': ['E_low', 'A', 'D', 'G', 'B', 'E_high'],
-        'fretboard': [
-            ['E (82.41 Hz)', 'F (87.31 Hz)', 'F#/Gb (92.5 Hz)', 'G (98.0 Hz)', 'G#/Ab (103.83 Hz)', 'A (110.0 Hz)', 'A#/Bb (116.55 Hz)', 'B (123.48 Hz)', 'C (130.82 Hz)', 'C#/Db (138.6 Hz)', 'D (146.84 Hz)', 'D#/Eb (155.57 Hz)', 'E (164.82 Hz)'],
-            ['A (110.0 Hz)', 'A#/Bb (116.54 Hz)', 'B (123.47 Hz)', 'C (130.81 Hz)', 'C#/Db (138.59 Hz)', 'D (146.83 Hz)', 'D#/Eb (155.56 Hz)', 'E (164.81 Hz)', 'F (174.61 Hz)', 'F#/Gb (185.0 Hz)', 'G (196.0 Hz)', 'G#/Ab (207.65 Hz)', 'A (220.0 Hz)'],
-            ['D (146.83 Hz)', 'D#/Eb (155.56 Hz)', 'E (164.81 Hz)', 'F (174.61 Hz)', 'F#/Gb (184.99 Hz)', 'G (195.99 Hz)', 'G#/Ab (207.65 Hz)', 'A (220.0 Hz)', 'A#/Bb (233.08 Hz)', 'B (246.94 Hz)', 'C (261.62 Hz)', 'C#/Db (277.18 Hz)', 'D (293.66 Hz)'],
-            ['G (196.0 Hz)', 'G#/Ab (207.65 Hz)', 'A (220.0 Hz)', 'A#/Bb (233.08 Hz)', 'B (246.94 Hz)', 'C (261.63 Hz)', 'C#/Db (277.19 Hz)', 'D (293.67 Hz)', 'D#/Eb (311.13 Hz)', 'E (329.63 Hz)', 'F (349.23 Hz)', 'F#/Gb (370.0 Hz)', 'G (392.0 Hz)'],
-            ['B (246.94 Hz)', 'C (261.62 Hz)', 'C#/Db (277.18 Hz)', 'D (293.66 Hz)', 'D#/Eb (311.12 Hz)', 'E (329.63 Hz)', 'F (349.23 Hz)', 'F#/Gb (369.99 Hz)', 'G (391.99 Hz)', 'G#/Ab (415.3 Hz)', 'A (440.0 Hz)', 'A#/Bb (466.16 Hz)', 'B (493.88 Hz)'],
-            ['E (329.63 Hz)', 'F (349.23 Hz)', 'F#/Gb (370.0 Hz)', 'G (392.0 Hz)', 'G#/Ab (415.31 Hz)', 'A (440.0 Hz)', 'A#/Bb (466.17 Hz)', 'B (493.89 Hz)', 'C (523.26 Hz)', 'C#/Db (554.37 Hz)', 'D (587.33 Hz)', 'D#/Eb (622.26 Hz)', 'E (659.26 Hz)']
-        ]
-    }
+    # Tuning and A4 reference drive a computed (string, fret) frequency table
+    tuning_name = st.sidebar.selectbox('Tuning:', list(tunings.keys()), key='tuning_select')
+    a4 = st.sidebar.number_input('A4 reference (Hz):', min_value=400.0, max_value=480.0, value=DEFAULT_A4, step=0.5, key='a4_reference')
+    tuning = tunings[tuning_name]
+    fret_midi = fretboard_midi(tuning, FRET_COUNT)
+    fret_frequencies = fretboard_frequencies(tuning, FRET_COUNT, a4)
 
     if 'selected_notes' not in st.session_state:
         st.session_state['selected_notes'] = []
@@ -142,28 +169,22 @@ def fretboard_select():
         </style>
         """, unsafe_allow_html=True)
 
-    strings = guitar_string_frequencies['strings'][::-1]  # Reverse the order of strings for display
-
-    for i, string_name in enumerate(strings):
+    # Display the highest string first, like looking down at the neck
+    for string_index in reversed(range(len(tuning))):
+        string_name = tuning[string_index][0]
         st.markdown('<div class="string-line"></div>', unsafe_allow_html=True)
-        cols = st.columns(13)
-        for idx in range(13):
-            # Note that we access the fretboard using the original index of the string before it was reversed
-            original_string_index = len(guitar_string_frequencies['strings']) - 1 - i
-            note_info = guitar_string_frequencies['fretboard'][original_string_index][idx]
-            # Splitting the note_info to extract the note name correctly
-            note_parts = note_info.split(' ')
-            # Assuming the note name is everything except the last two elements (frequency and Hz)
-            note_name = ' '.join(note_parts[:-2])
-            frequency = note_parts[-2]  # The frequency value
-            
+        cols = st.columns(FRET_COUNT)
+        for idx in range(FRET_COUNT):
+            note_name = midi_to_note(fret_midi[string_index][idx])
+
             button_key = f"button_{string_name}_{idx}"
-            if cols[idx].button(note_name, key=button_key):  # Ensure note_name is a string
+            if cols[idx].button(note_name, key=button_key):
                 selected_note_info = {
                     'note': note_name,
                     'string': string_name,
                     'fret': idx,
-                    'frequency': frequency + ' Hz'  # Adding 'Hz' for clarity
+                    'midi': fret_midi[string_index][idx],
+                    'frequency': float(fret_frequencies[string_index, idx]),  # Hz
                 }
                 if selected_note_info not in st.session_state['selected_notes']:
                     st.session_state['selected_notes'].append(selected_note_info)
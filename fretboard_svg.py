@@ -0,0 +1,75 @@
+"""
+Matplotlib-free fretboard renderer.
+
+Emits the same layout as the matplotlib fretboard (an 18x5 inch figure with the default
+subplot margins, data range 0..frets x 0..7) directly as SVG, using 100 user units per
+inch. The output is a few KB of markup that can be embedded straight into the page.
+"""
+from html import escape
+
+from chords import is_note_in_chord, get_note_color
+from note_sets import guitar_strings_standard
+
+
+string_order = ['E_low', 'A', 'D', 'G', 'B', 'E_high']
+
+FIGURE_WIDTH, FIGURE_HEIGHT = 1800, 500
+# matplotlib's default subplot parameters
+AXES_LEFT, AXES_RIGHT = 0.125 * FIGURE_WIDTH, 0.9 * FIGURE_WIDTH
+AXES_BOTTOM, AXES_TOP = (1 - 0.11) * FIGURE_HEIGHT, (1 - 0.88) * FIGURE_HEIGHT
+POINT = 100 / 72  # one typographic point in user units
+EDGE_PADDING = 40  # room for labels on the edge frets, same as the PNG crop
+
+FONT_SIZE = 12 * POINT
+LABEL_PAD = 0.3 * FONT_SIZE
+CHAR_WIDTH = 0.6 * FONT_SIZE  # rough advance width of the default sans-serif font
+
+
+def _x(fret, frets):
+    return AXES_LEFT + fret / frets * (AXES_RIGHT - AXES_LEFT)
+
+
+def _y(position):
+    return AXES_BOTTOM - position / 7 * (AXES_BOTTOM - AXES_TOP)
+
+
+def render_fretboard_svg(note_colors, chord_notes, chord_degrees, show_degrees=False, frets=15):
+    left, top = AXES_LEFT - EDGE_PADDING, AXES_TOP - EDGE_PADDING
+    width = AXES_RIGHT - AXES_LEFT + 2 * EDGE_PADDING
+    height = AXES_BOTTOM - AXES_TOP + 2 * EDGE_PADDING
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{left:.1f} {top:.1f} {width:.1f} {height:.1f}" '
+        f'width="100%" style="background:#fff" font-family="DejaVu Sans, Arial, sans-serif">'
+    ]
+
+    x_start, x_end = _x(0, frets), _x(frets, frets)
+    for string_number in range(1, len(string_order) + 1):
+        y = _y(string_number)
+        parts.append(f'<line x1="{x_start:.1f}" y1="{y:.1f}" x2="{x_end:.1f}" y2="{y:.1f}" stroke="black" stroke-width="{2 * POINT:.2f}"/>')
+
+    y_low, y_high = _y(1), _y(6)
+    for fret in range(1, frets + 1):
+        x = _x(fret, frets)
+        parts.append(f'<line x1="{x:.1f}" y1="{y_low:.1f}" x2="{x:.1f}" y2="{y_high:.1f}" stroke="grey" stroke-width="{POINT:.2f}"/>')
+
+    dot_radius = 7 * POINT / 2
+    for fret, position in [(3, 0.2), (5, 0.2), (7, 0.2), (9, 0.2), (12, 0.1), (12, 0.4)]:
+        parts.append(f'<circle cx="{_x(fret, frets):.1f}" cy="{_y(position):.1f}" r="{dot_radius:.2f}" fill="black"/>')
+
+    for string_number, string_name in enumerate(string_order, start=1):
+        y = _y(string_number)
+        for fret in range(0, frets):
+            note = guitar_strings_standard[string_name][fret % 12]
+            if is_note_in_chord(note, chord_notes):
+                display_text = note if not show_degrees else chord_degrees[chord_notes.index(note)]
+                x = _x(fret, frets)
+                box_width = len(display_text) * CHAR_WIDTH + 2 * LABEL_PAD
+                box_height = FONT_SIZE + 2 * LABEL_PAD
+                parts.append(
+                    f'<rect x="{x - box_width / 2:.1f}" y="{y - box_height / 2:.1f}" width="{box_width:.1f}" height="{box_height:.1f}" '
+                    f'rx="{LABEL_PAD:.1f}" fill="{get_note_color(note, note_colors)}"/>'
+                    f'<text x="{x:.1f}" y="{y:.1f}" font-size="{FONT_SIZE:.1f}" text-anchor="middle" dominant-baseline="central">{escape(display_text)}</text>'
+                )
+
+    parts.append('</svg>')
+    return ''.join(parts)
@@ -1,8 +1,12 @@
+import io
+from threading import Lock
+
 import streamlit as st
-import matplotlib.pyplot as plt
 
-from chords import is_note_in_chord
+from chords import is_note_in_chord, get_note_color
 from note_sets import guitar_strings_standard
+from fretboard_svg import render_fretboard_svg, string_order
+from render_cache import RenderCache
 
 
 guitar_strings_standard = {
@@ -26,48 +30,105 @@ chromatic_scale = [
 
 
 
-def get_note_color(note, note_colors):
-    # Directly return the color if the note exactly matches one of the keys
-    if note in note_colors:
-        return note_colors[note]
-    
-    # Handle notes written with sharp/flat notation
-    for key in note_colors.keys():
-        if note in key.split('/'):
-            return note_colors[key]
-    
-    # Fallback color if note is not found
-    return '#FFFFFF'  # White or any default color
-
-
-def guitar_fretboard_visualization(note_colors, chord_notes, chord_degrees, show_degrees=False):
-    fig, ax = plt.subplots(figsize=(18, 5))
-    for string_number, string_name in enumerate(['E_low', 'A', 'D', 'G', 'B', 'E_high'], start=1):
-        ax.plot([0, 15], [string_number, string_number], color='black', lw=2)
-        
-        for fret in range(0, 15):
-            note = guitar_strings_standard[string_name][fret % 12]
-            if is_note_in_chord(note, chord_notes):
-                note_color = get_note_color(note, note_colors)  # Assume this function returns a color based on the note
-                
-                # Determine what to display (note or degree) and set color
-                display_text = note if not show_degrees else chord_degrees[chord_notes.index(note)]
-                text_color = 'black'  # Assuming white text for visibility against colored backgrounds
-                
-                ax.text(fret, string_number, display_text, ha='center', va='center', color=text_color, fontsize=12, bbox=dict(facecolor=note_color, edgecolor='none', boxstyle='round,pad=0.3'))
-    
-    for fret in range(1, 16):
-        ax.plot([fret, fret], [1, 6], color='grey', lw=1)
-    
-    single_dot_frets = [3, 5, 7, 9]
-    for fret in single_dot_frets:
-        ax.plot(fret, 0.2, 'o', markersize=7, color='black', fillstyle='full')
-
-    ax.plot(12, 0.1, 'o', markersize=7, color='black', fillstyle='full')
-    ax.plot(12, 0.4, 'o', markersize=7, color='black', fillstyle='full')
-
-    ax.axis([0, 15, 0, 7])
-    ax.axis('off')
-    st.pyplot(fig)
+# Rendered fretboards keyed on everything that changes the picture
+fretboard_render_cache = RenderCache(maxsize=128)
+
+
+# The strings, fret lines and inlays never change, so they are drawn once per fret count into
+# a persistent Agg canvas. Each chord render restores that raster and only draws its note labels.
+RENDER_DPI = 200
+_background_layers = {}
+_background_lock = Lock()  # the layers share one canvas each, so renders take turns
+
+
+def _fretboard_background(frets):
+    layer = _background_layers.get(frets)
+    if layer is None:
+        # matplotlib is only loaded once a PNG fretboard is actually requested
+        from figure_manager import figure_manager
+
+        fig = figure_manager.new_figure((18, 5), dpi=RENDER_DPI)
+        canvas = fig.canvas
+        ax = fig.add_subplot()
+        for string_number in range(1, len(string_order) + 1):
+            ax.plot([0, frets], [string_number, string_number], color='black', lw=2)
+
+        for fret in range(1, frets + 1):
+            ax.plot([fret, fret], [1, 6], color='grey', lw=1)
+
+        single_dot_frets = [3, 5, 7, 9]
+        for fret in single_dot_frets:
+            ax.plot(fret, 0.2, 'o', markersize=7, color='black', fillstyle='full')
+
+        ax.plot(12, 0.1, 'o', markersize=7, color='black', fillstyle='full')
+        ax.plot(12, 0.4, 'o', markersize=7, color='black', fillstyle='full')
+
+        ax.axis([0, frets, 0, 7])
+        ax.axis('off')
+
+        canvas.draw()
+        background = canvas.copy_from_bbox(fig.bbox)
+
+        # Crop to the axes plus room for labels sitting on the edge frets (display coords are bottom-up)
+        x0, y0, x1, y1 = ax.bbox.padded(0.4 * RENDER_DPI).extents
+        width, height = fig.bbox.width, fig.bbox.height
+        crop = (
+            slice(int(max(height - y1, 0)), int(min(height - y0, height))),
+            slice(int(max(x0, 0)), int(min(x1, width))),
+        )
+        layer = _background_layers[frets] = (fig, ax, background, crop)
+    return layer
+
+
+def render_fretboard_png(note_colors, chord_notes, chord_degrees, show_degrees=False, frets=15):
+    import numpy as np
+    from PIL import Image
+
+    with _background_lock:
+        fig, ax, background, crop = _fretboard_background(frets)
+        fig.canvas.restore_region(background)
+
+        for string_number, string_name in enumerate(string_order, start=1):
+            for fret in range(0, frets):
+                note = guitar_strings_standard[string_name][fret % 12]
+                if is_note_in_chord(note, chord_notes):
+                    note_color = get_note_color(note, note_colors)
+
+                    # Determine what to display (note or degree) and set color
+                    display_text = note if not show_degrees else chord_degrees[chord_notes.index(note)]
+                    text_color = 'black'
+
+                    label = ax.text(fret, string_number, display_text, ha='center', va='center', color=text_color, fontsize=12, bbox=dict(facecolor=note_color, edgecolor='none', boxstyle='round,pad=0.3'))
+                    ax.draw_artist(label)
+                    label.remove()
+
+        pixels = np.asarray(fig.canvas.buffer_rgba())[crop].copy()
+
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format='png', compress_level=1)
+    return buffer.getvalue()
+
 
+def guitar_fretboard_visualization(note_colors, chord_notes, chord_degrees, show_degrees=False, frets=15, backend='png'):
+    """Shows the fretboard for a chord; backend is 'png' (matplotlib) or 'svg' (inline markup)."""
+    cache_key = (
+        backend,
+        tuple(chord_notes),
+        tuple(chord_degrees),
+        tuple(sorted(note_colors.items())),
+        show_degrees,
+        frets,
+    )
+    if backend == 'svg':
+        svg = fretboard_render_cache.get_or_render(
+            cache_key,
+            lambda: render_fretboard_svg(note_colors, chord_notes, chord_degrees, show_degrees, frets),
+        )
+        st.markdown(svg, unsafe_allow_html=True)
+        return
 
+    png = fretboard_render_cache.get_or_render(
+        cache_key,
+        lambda: render_fretboard_png(note_colors, chord_notes, chord_degrees, show_degrees, frets),
+    )
+    st.image(png, width='stretch')
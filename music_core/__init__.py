@@ -0,0 +1,24 @@
+"""
+Headless music theory core: chords, scales and progressions with no Streamlit or matplotlib
+imports, so batch jobs and API servers can use it without loading the UI stack.
+"""
+from music_core.notes import (
+    chromatic_scale,
+    circle_of_fifths_notes,
+    degree_names,
+    guitar_strings_standard,
+    interval_to_degree,
+    mode_intervals,
+    note_index,
+)
+from music_core.chords import (
+    calculate_chord_notes,
+    chord_intervals,
+    chord_symbols,
+    get_borrowed_chords,
+    get_chord_type_from_part,
+    progression_to_root_notes,
+)
+from music_core.progressions import parse_chord, parse_progression, progression_chords, realize_progression
+from music_core.scales import get_scale_notes_and_degrees
+from music_core.voicings import find_voicings, format_voicing, voicing_midi
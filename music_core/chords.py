@@ -0,0 +1,134 @@
+"""
+Note on Chord Notation Simplification:
+In this implementation, we use a simplified model for chord notation that combines sharp(#) and flat(b) symbols together (e.g., A#/Bb) for enharmonic equivalents. This approach allows for a more straightforward representation and understanding of chords without delving into the complexities of classical music theory which distinguishes between enharmonically equivalent notes based on context (e.g., G# vs. Ab).
+
+Specifically, for the diminished 7th chord, we list the 7th degree as '6' instead of the theoretically correct 'bb7' (double flat 7). This decision is made to keep the model simple and accessible, acknowledging that while it may not align with traditional theory's precise notation, it provides a practical and functional understanding suitable for most contemporary music applications. This simplification enables users to easily identify chord components without the need for advanced theory knowledge regarding enharmonic distinctions and double flattened intervals.
+"""
+from music_core.notes import chromatic_scale, mode_intervals, note_index, interval_to_degree
+from music_core.pitch_masks import intervals_to_mask, is_subset, is_superset, shared_mask
+from music_core.progressions import parse_chord, realize_progression
+
+
+chord_intervals = {
+    'major': [0, 4, 7],
+    'minor': [0, 3, 7],
+    'power': [0, 7],  # Optionally add 12 for the octave: [0, 7, 12]
+    'dominant_7th': [0, 4, 7, 10],
+    'major_7th': [0, 4, 7, 11],
+    'minor_7th': [0, 3, 7, 10],
+    'suspended_4th': [0, 5, 7],
+    'suspended_2nd': [0, 2, 7],
+    'augmented': [0, 4, 8],
+    'diminished': [0, 3, 6],
+    'diminished_7th': [0, 3, 6, 9],
+    'half_diminished_7th': [0, 3, 6, 10],
+    'add9': [0, 4, 7, 14],
+    'minor_add9': [0, 3, 7, 14],
+    '6th': [0, 4, 7, 9],
+    'minor_6th': [0, 3, 7, 9]
+}
+
+# Pitch-class mask per chord type
+chord_masks = {chord: intervals_to_mask(intervals) for chord, intervals in chord_intervals.items()}
+_chord_intervals_table = chord_intervals  # the parameter below shadows the module name
+
+
+def calculate_chord_notes(root_note, chord_type):
+    root_index = note_index.get(root_note)
+    if root_index is None:
+        return [], []
+
+    intervals = chord_intervals[chord_type]
+    chord_notes = [chromatic_scale[(root_index + interval) % 12] for interval in intervals]
+    degrees = [interval_to_degree(interval) for interval in intervals]
+    return chord_notes, degrees
+
+
+# Updated function to find related chords that also calculates the notes for display
+def find_related_chords_and_notes_categorized(selected_chord_type, chord_intervals, root_note):
+    related_chords = {
+        'Superset': {},
+        'Subset': {},
+        'Shares common intervals with': {}
+    }
+    # Pitch-class masks: subset / superset / shared checks are single bitwise operations.
+    # The app passes the module table, whose masks are built once at import.
+    if chord_intervals is _chord_intervals_table:
+        masks = chord_masks
+    else:
+        masks = {chord: intervals_to_mask(intervals) for chord, intervals in chord_intervals.items()}
+    selected_mask = masks[selected_chord_type]
+
+    for chord, mask in masks.items():
+        if selected_chord_type != chord:
+            relation = None
+            if is_subset(selected_mask, mask):
+                relation = 'Superset'
+            elif is_superset(selected_mask, mask):
+                relation = 'Subset'
+            elif shared_mask(selected_mask, mask):
+                relation = 'Shares common intervals with'
+
+            if relation:
+                # Calculate the chord notes for display
+                chord_notes = calculate_chord_notes(root_note, chord)
+                related_chords[relation][chord] = chord_notes
+    
+    return related_chords
+
+def is_note_in_chord(note, chord_notes):
+    return note in chord_notes
+
+
+chord_symbols = {
+    'major': "",
+    'minor': "m",
+    'dominant_7th': "7",
+    'major_7th': "M7",
+    'minor_7th': "m7",
+    'diminished': "dim",
+    'augmented': "aug",
+    'suspended_2nd': "sus2",
+    'suspended_4th': "sus4",
+    'power': "P",  
+    'diminished_7th': "dim7",
+    'half_diminished_7th': "m7(b5)", 
+    'add9': "add9",
+    'minor_add9': "m(add9)",
+    '6th': "6",
+    'minor_6th': "m6"
+}
+
+
+def get_chord_type_from_part(part):
+    """chord_intervals key for one Roman-numeral chord, e.g. 'ii7' -> 'minor_7th'."""
+    return parse_chord(part).chord_type
+
+
+def progression_to_root_notes(root_note, progression):
+    """Root note of every chord in a progression like 'I-vi-IV-V' in the key of root_note."""
+    return [chord.root for chord in realize_progression(root_note, progression)]
+
+parallel_modes = {
+    'Ionian': 'Aeolian',
+    'Aeolian': 'Ionian',
+    'Dorian': 'Phrygian',
+    'Phrygian': 'Lydian',
+    'Lydian': 'Mixolydian',
+    'Mixolydian': 'Locrian',
+    'Locrian': 'Harmonic Minor'
+}
+
+
+def get_borrowed_chords(current_mode, tonic):
+    if current_mode not in parallel_modes:
+        return []
+    parallel_mode = parallel_modes[current_mode]
+    parallel_intervals = mode_intervals[parallel_mode]
+    borrowed_chords = []
+    for degree in parallel_intervals:
+        root_note = chromatic_scale[(note_index[tonic] + degree) % 12]
+        chord_type = 'major' if degree % 2 == 0 else 'minor'  # Simplification for demonstration
+        chord_notes, chord_degrees = calculate_chord_notes(root_note, chord_type)
+        borrowed_chords.append((root_note, chord_type, chord_notes, chord_degrees))
+    return borrowed_chords
@@ -0,0 +1,79 @@
+"""
+Note names, modes and degree labels shared by the whole app.
+"""
+from music_core.pitch_masks import intervals_to_mask
+
+
+guitar_strings_standard = {
+    'E_low': ['E', 'F', 'F#/Gb', 'G', 'G#/Ab', 'A', 'A#/Bb', 'B', 'C', 'C#/Db', 'D', 'D#/Eb', 'E'],
+    'A': ['A', 'A#/Bb', 'B', 'C', 'C#/Db', 'D', 'D#/Eb', 'E', 'F', 'F#/Gb', 'G', 'G#/Ab', 'A'],
+    'D': ['D', 'D#/Eb', 'E', 'F', 'F#/Gb', 'G', 'G#/Ab', 'A', 'A#/Bb', 'B', 'C', 'C#/Db', 'D'],
+    'G': ['G', 'G#/Ab', 'A', 'A#/Bb', 'B', 'C', 'C#/Db', 'D', 'D#/Eb', 'E', 'F', 'F#/Gb', 'G'],
+    'B': ['B', 'C', 'C#/Db', 'D', 'D#/Eb', 'E', 'F', 'F#/Gb', 'G', 'G#/Ab', 'A', 'A#/Bb', 'B'],
+    'E_high': ['E', 'F', 'F#/Gb', 'G', 'G#/Ab', 'A', 'A#/Bb', 'B', 'C', 'C#/Db', 'D', 'D#/Eb', 'E']
+}
+
+
+
+# The Circle of Fifths notes (simplified for visualization)
+circle_of_fifths_notes = ['C','F','A#/Bb','D#/Eb','G#/Ab','C#/Db','F#/Gb','B','E','A','D','G']
+
+# ['C','F','Bb','Eb','Ab','Db','Gb','B','E','A','D','G']
+
+# Comprehensive chromatic scale including both sharps and flats
+# Note: This simplification serves to explain the concept. In a real application,
+# you would need to dynamically adjust the chromatic scale based on the root note.
+chromatic_scale = [
+    'C', 'C#/Db', 'D', 'D#/Eb', 'E', 'F', 'F#/Gb', 'G', 'G#/Ab', 'A', 'A#/Bb', 'B'
+]
+
+# Note name -> pitch class (0-11), replaces chromatic_scale.index() scans
+note_index = {note: i for i, note in enumerate(chromatic_scale)}
+
+
+
+mode_intervals = {
+    'Ionian': [0, 2, 4, 5, 7, 9, 11],
+    'Dorian': [0, 2, 3, 5, 7, 9, 10],
+    'Phrygian': [0, 1, 3, 5, 7, 8, 10],
+    'Lydian': [0, 2, 4, 6, 7, 9, 11],
+    'Mixolydian': [0, 2, 4, 5, 7, 9, 10],
+    'Aeolian': [0, 2, 3, 5, 7, 8, 10],
+    'Locrian': [0, 1, 3, 5, 6, 8, 10],
+    # 'Harmonic Minor': [0, 2, 3, 5, 7, 8, 11],
+    # 'Melodic Minor Ascending': [0, 2, 3, 5, 7, 9, 11],
+    # 'Melodic Minor Descending': [0, 2, 4, 5, 7, 8, 10]  # Same as natural minor when descending, but included so I don't need to write logic for that similarity. 
+                                                        # Idk what it'd be for yet. Maybe a function to detect a similarity in interval pattern with something else...
+}
+
+# Pitch-class masks (see pitch_masks.py) built once so scale membership is a bit test
+mode_masks = {mode: intervals_to_mask(intervals) for mode, intervals in mode_intervals.items()}
+
+
+degree_names = {
+        0: 'R',
+        1: 'b2',
+        2: '2',
+        3: 'b3',
+        4: '3',
+        5: '4',
+        6: 'b5',
+        7: '5',
+        8: '#5',
+        9: '6',
+        10: 'b7',
+        11: '7',
+        12: 'R',  # Octave
+        13: 'b9',
+        14: '9',
+        15: '#9',
+        17: '11',
+        18: '#11',
+        20: 'b13',
+        21: '13',
+        # Add more as necessary
+    }
+
+def interval_to_degree(interval):
+
+    return degree_names.get(interval, '?')
@@ -0,0 +1,56 @@
+"""
+12-bit pitch-class masks.
+
+Every chord or scale is stored as an integer where bit i is set when pitch class i
+(0 = C, 1 = C#/Db, ... 11 = B) is present. Paired with a root index this is enough to
+answer subset / superset / shared-note questions with a single bitwise operation, and
+transposing is just a 12-bit rotation.
+"""
+
+FULL_MASK = 0xFFF
+
+
+def intervals_to_mask(intervals, root=0):
+    """Builds a mask from semitone intervals above a root index (intervals above 11 wrap)."""
+    mask = 0
+    for interval in intervals:
+        mask |= 1 << ((root + interval) % 12)
+    return mask
+
+
+def pitch_classes_to_mask(pitch_classes):
+    mask = 0
+    for pitch_class in pitch_classes:
+        mask |= 1 << (pitch_class % 12)
+    return mask
+
+
+def mask_to_pitch_classes(mask):
+    return [i for i in range(12) if mask >> i & 1]
+
+
+def transpose_mask(mask, semitones):
+    """Rotates a mask up by the given number of semitones."""
+    semitones %= 12
+    return ((mask << semitones) | (mask >> (12 - semitones))) & FULL_MASK
+
+
+def mask_size(mask):
+    return bin(mask).count('1')
+
+
+def is_subset(mask, other):
+    """True when every pitch class in mask is also in other."""
+    return mask & other == mask
+
+
+def is_superset(mask, other):
+    return mask & other == other
+
+
+def shared_mask(mask, other):
+    return mask & other
+
+
+def contains_pitch_class(mask, pitch_class):
+    return bool(mask >> (pitch_class % 12) & 1)
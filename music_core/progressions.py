@@ -0,0 +1,187 @@
+"""
+Tokenizer and parser for Roman-numeral progressions like 'I-vi-IV-V7' or 'bVII-IVmaj7/I'.
+
+Grammar (one chord per '-' separated part):
+
+    chord    := accidental* numeral quality? extension* ('/' bass)?
+    bass     := accidental* numeral
+    numeral  := I II III IV V VI VII, lowercase for minor
+    accidental := b # (also the unicode flat / sharp)
+    quality  := m M maj7 M7 m7(b5) ø dim7 dim ° aug + sus2 sus4 P 5
+    extension := 7 6 add9
+
+Each part compiles to a ChordNode with the chord_intervals type already resolved, and the
+slash bass is a numeral relative to the key (IV/I is IV over the tonic). Parses are cached
+per part and per progression, so re-parsing or transposing a progression is a dict lookup.
+"""
+from collections import namedtuple
+from functools import lru_cache
+
+from music_core.notes import chromatic_scale, note_index
+
+
+roman_numeral_intervals = {
+    "Tonic": {"numerals": ["I", "i"], "interval": 0},
+    "Supertonic": {"numerals": ["II", "ii"], "interval": 2},
+    "Mediant": {"numerals": ["III", "iii"], "interval": 4},
+    "Subdominant": {"numerals": ["IV", "iv"], "interval": 5},
+    "Dominant": {"numerals": ["V", "v"], "interval": 7},
+    "Submediant": {"numerals": ["VI", "vi"], "interval": 9},
+    "Leading Tone": {"numerals": ["VII", "vii"], "interval": 11}
+}
+
+numeral_intervals = {
+    numeral: value["interval"] for value in roman_numeral_intervals.values() for numeral in value["numerals"]
+}
+
+accidental_offsets = {'b': -1, '♭': -1, '#': 1, '♯': 1}
+
+# Spellings of each quality token
+quality_aliases = {
+    'm7(b5)': 'half_diminished', 'ø': 'half_diminished', 'ø7': 'half_diminished',
+    'dim7': 'diminished_7', '°7': 'diminished_7',
+    'dim': 'diminished', '°': 'diminished',
+    'aug': 'augmented', '+': 'augmented',
+    'maj7': 'major_7', 'M7': 'major_7',
+    'sus2': 'sus2', 'sus4': 'sus4',
+    'P': 'power', '5': 'power',
+    'm': 'minor', 'M': 'major',
+}
+
+Token = namedtuple('Token', ['kind', 'text', 'position'])
+Numeral = namedtuple('Numeral', ['accidental', 'text', 'interval', 'minor'])
+ChordNode = namedtuple('ChordNode', ['numeral', 'quality', 'extensions', 'bass', 'chord_type'])
+RealizedChord = namedtuple('RealizedChord', ['root', 'chord_type', 'bass'])
+
+
+@lru_cache(maxsize=1)
+def token_pattern():
+    """The tokenizer regex, compiled on first use so importing music_core doesn't pay for re."""
+    import re
+
+    def alternation(options):
+        # Longest spelling first so e.g. 'dim7' wins over 'dim' and 'VII' over 'V'
+        return '|'.join(re.escape(option) for option in sorted(options, key=len, reverse=True))
+
+    return re.compile('|'.join(f'(?P<{kind}>{pattern})' for kind, pattern in (
+        ('numeral', alternation(numeral_intervals)),
+        ('quality', alternation(quality_aliases)),
+        ('extension', r'add9|7|6'),
+        ('accidental', alternation(accidental_offsets)),
+        ('slash', r'/'),
+        ('space', r'\s+'),
+        ('error', r'.'),
+    )))
+
+
+def tokenize(text):
+    for match in token_pattern().finditer(text):
+        kind = match.lastgroup
+        if kind == 'space':
+            continue
+        if kind == 'error':
+            raise ValueError(f"Unexpected {match.group()!r} at position {match.start()} in {text!r}")
+        yield Token(kind, match.group(), match.start())
+
+
+class _Parser:
+    def __init__(self, text):
+        self.text = text
+        self.tokens = list(tokenize(text))
+        self.position = 0
+
+    def peek(self, kind):
+        return self.position < len(self.tokens) and self.tokens[self.position].kind == kind
+
+    def take(self, kind):
+        if not self.peek(kind):
+            found = self.tokens[self.position].text if self.position < len(self.tokens) else 'end of input'
+            raise ValueError(f"Expected {kind}, found {found!r} in {self.text!r}")
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def numeral(self):
+        accidental = 0
+        while self.peek('accidental'):
+            accidental += accidental_offsets[self.take('accidental').text]
+        text = self.take('numeral').text
+        return Numeral(accidental, text, (numeral_intervals[text] + accidental) % 12, text.islower())
+
+    def chord(self):
+        numeral = self.numeral()
+        quality = quality_aliases[self.take('quality').text] if self.peek('quality') else None
+        extensions = []
+        while self.peek('extension'):
+            extensions.append(self.take('extension').text)
+        bass = None
+        if self.peek('slash'):
+            self.take('slash')
+            bass = self.numeral()
+        return ChordNode(numeral, quality, tuple(extensions), bass, resolve_chord_type(numeral, quality, extensions, self.text))
+
+
+def resolve_chord_type(numeral, quality, extensions, text=''):
+    """Maps a numeral's case, quality and extensions onto a chord_intervals key."""
+    minor = quality == 'minor' or (numeral.minor and quality != 'major')
+    if quality == 'half_diminished':
+        return 'half_diminished_7th'
+    if quality == 'diminished_7' or (quality == 'diminished' and '7' in extensions):
+        return 'diminished_7th'
+    if quality == 'diminished':
+        return 'diminished'
+    if quality == 'augmented':
+        return 'augmented'
+    if quality == 'sus2':
+        return 'suspended_2nd'
+    if quality == 'sus4':
+        return 'suspended_4th'
+    if quality == 'power':
+        return 'power'
+    if quality == 'major_7':
+        if numeral.minor:
+            raise ValueError(f"Minor-major sevenths are not supported: {text!r}")
+        return 'major_7th'
+    if 'add9' in extensions:
+        return 'minor_add9' if minor else 'add9'
+    if '7' in extensions:
+        return 'minor_7th' if minor else 'dominant_7th'
+    if '6' in extensions:
+        return 'minor_6th' if minor else '6th'
+    return 'minor' if minor else 'major'
+
+
+@lru_cache(maxsize=4096)
+def parse_chord(part):
+    """ChordNode for one Roman-numeral chord like 'ii7' or 'bVIImaj7/I'."""
+    parser = _Parser(part)
+    node = parser.chord()
+    if parser.position < len(parser.tokens):
+        token = parser.tokens[parser.position]
+        raise ValueError(f"Unexpected {token.text!r} at position {token.position} in {part!r}")
+    return node
+
+
+@lru_cache(maxsize=1024)
+def parse_progression(progression):
+    """Tuple of ChordNodes for a '-' separated progression (chords shared between progressions parse once)."""
+    return tuple(parse_chord(part.strip()) for part in progression.split('-'))
+
+
+@lru_cache(maxsize=4096)
+def realize_progression(key, progression):
+    """Tuple of RealizedChord(root note, chord type, bass note or None) in the given key."""
+    key_index = note_index[key]
+    return tuple(
+        RealizedChord(
+            chromatic_scale[(key_index + node.numeral.interval) % 12],
+            node.chord_type,
+            chromatic_scale[(key_index + node.bass.interval) % 12] if node.bass else None,
+        )
+        for node in parse_progression(progression)
+    )
+
+
+def progression_chords(progression, key):
+    """[(root note, chord type), ...] for a progression like 'I-vi-IV-V' in the given key."""
+    return [(chord.root, chord.chord_type) for chord in realize_progression(key, progression)]
@@ -0,0 +1,23 @@
+from music_core.notes import chromatic_scale, mode_intervals, mode_masks, note_index, interval_to_degree
+from music_core.pitch_masks import contains_pitch_class
+
+
+def get_scale_notes_and_degrees(mode, root_note, ascending=True):
+    """Retrieve scale notes and corresponding degrees for a given mode starting from the root note."""
+    if not ascending and 'Melodic Minor' in mode:
+        mode = mode.replace("Ascending", "Descending")
+    intervals = mode_intervals.get(mode, [])
+    root_index = note_index[root_note]
+
+    notes = [chromatic_scale[(root_index + interval) % 12] for interval in intervals]
+
+    # b6 and #5 share a pitch class: call it #5 only when the scale has no perfect 5th
+    five_in_set = contains_pitch_class(mode_masks.get(mode, 0), 7)
+    degrees = []
+    for interval in intervals:
+        if interval == 8:
+            degrees.append('b6' if five_in_set else '#5')
+        else:
+            degrees.append(interval_to_degree(interval))
+
+    return notes, degrees
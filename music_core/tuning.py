@@ -0,0 +1,49 @@
+"""
+Equal-temperament frequencies from MIDI note numbers.
+
+Tunings are tuples of (string name, open-string MIDI note) from low to high, so they can be
+used as cache keys. Frequencies are always computed, never typed in, so every fret of every
+string agrees with the chosen A4 reference.
+"""
+from functools import lru_cache
+
+from music_core.notes import chromatic_scale
+
+
+A4_MIDI = 69
+DEFAULT_A4 = 440.0
+
+standard_tuning = (('E_low', 40), ('A', 45), ('D', 50), ('G', 55), ('B', 59), ('E_high', 64))
+
+# String names follow the open pitch, with _low / _high where a letter appears twice
+tunings = {
+    'Standard': standard_tuning,
+    'Drop D': (('D_low', 38), ('A', 45), ('D', 50), ('G', 55), ('B', 59), ('E_high', 64)),
+    'Half step down': (('Eb_low', 39), ('Ab', 44), ('Db', 49), ('Gb', 54), ('Bb', 58), ('Eb_high', 63)),
+    'DADGAD': (('D_low', 38), ('A', 45), ('D', 50), ('G', 55), ('A_high', 57), ('D_high', 62)),
+}
+
+
+def midi_to_frequency(midi, a4=DEFAULT_A4):
+    return a4 * 2 ** ((midi - A4_MIDI) / 12)
+
+
+def midi_to_note(midi):
+    return chromatic_scale[midi % 12]
+
+
+@lru_cache(maxsize=32)
+def fretboard_midi(tuning=standard_tuning, frets=13):
+    """(string, fret) -> MIDI note number, as a tuple of per-string tuples."""
+    return tuple(tuple(open_midi + fret for fret in range(frets)) for _, open_midi in tuning)
+
+
+@lru_cache(maxsize=32)
+def fretboard_frequencies(tuning=standard_tuning, frets=13, a4=DEFAULT_A4):
+    """Read-only float array of shape (strings, frets) with the frequency of every position in Hz."""
+    import numpy as np  # kept local so music_core itself imports without NumPy
+
+    midi = np.array(fretboard_midi(tuning, frets), dtype=np.float64)
+    frequencies = a4 * np.exp2((midi - A4_MIDI) / 12)
+    frequencies.setflags(write=False)
+    return frequencies
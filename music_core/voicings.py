@@ -0,0 +1,110 @@
+"""
+Playable chord voicings.
+
+A voicing is a tuple with one entry per string, low to high: the fret played, or None for a
+muted string. The search walks the strings from low to high and keeps a partial shape only
+while it can still become playable. Branches are cut when:
+
+- the fretted notes would stretch past max_span frets,
+- the first sounding string is not the root (when root_in_bass is set),
+- there are fewer strings left than chord tones still missing.
+
+Muted strings are only allowed below the bass and above the top note, so every shape can be
+strummed. Results are memoized per (chord, tuning, constraints).
+"""
+from functools import lru_cache
+
+from music_core.chords import chord_intervals
+from music_core.notes import note_index
+from music_core.pitch_masks import intervals_to_mask, mask_size
+from music_core.tuning import standard_tuning
+
+
+DEFAULT_FRETS = 24
+DEFAULT_MAX_SPAN = 3  # highest fretted note minus lowest fretted note
+
+
+def find_voicings(root_note, chord_type, tuning=standard_tuning, max_span=DEFAULT_MAX_SPAN, frets=DEFAULT_FRETS,
+                  root_in_bass=True, allow_open=True, min_strings=3):
+    """Every playable voicing of a chord, ordered by neck position then span."""
+    return _search_voicings(note_index[root_note], tuple(chord_intervals[chord_type]), tuning,
+                            max_span, frets, root_in_bass, allow_open, min_strings)
+
+
+@lru_cache(maxsize=512)
+def _search_voicings(root, intervals, tuning, max_span, frets, root_in_bass, allow_open, min_strings):
+    chord_mask = intervals_to_mask(intervals, root)
+    min_strings = max(min_strings, mask_size(chord_mask))
+    lowest_fret = 0 if allow_open else 1
+    # Chord-tone frets per string, ascending
+    options = [
+        [fret for fret in range(lowest_fret, frets + 1) if chord_mask >> ((open_midi + fret) % 12) & 1]
+        for _, open_midi in tuning
+    ]
+    n_strings = len(tuning)
+    shape = [None] * n_strings
+    found = []
+
+    def search(string, covered, low, high, sounding):
+        remaining = n_strings - string
+        if mask_size(chord_mask & ~covered) > remaining or sounding + remaining < min_strings:
+            return
+        if string == n_strings:
+            found.append(tuple(shape))
+            return
+
+        open_midi = tuning[string][1]
+        for fret in options[string]:
+            if fret:
+                if high and fret > low + max_span:
+                    break  # options are ascending, so every later fret is out of reach too
+                if high and fret < high - max_span:
+                    continue
+            pitch_class = (open_midi + fret) % 12
+            if root_in_bass and not sounding and pitch_class != root:
+                continue
+            shape[string] = fret
+            if fret:
+                search(string + 1, covered | 1 << pitch_class, min(low, fret) if high else fret, max(high, fret), sounding + 1)
+            else:
+                search(string + 1, covered | 1 << pitch_class, low, high, sounding + 1)
+        shape[string] = None
+
+        if not sounding:
+            search(string + 1, covered, low, high, sounding)  # mute below the bass
+        elif covered == chord_mask and sounding >= min_strings:
+            # Mute everything above the top note
+            found.append(tuple(shape[:string]) + (None,) * remaining)
+
+    search(0, 0, 0, 0, 0)
+    found.sort(key=lambda voicing: (_position(voicing), _span(voicing), -_sounding(voicing)))
+    return tuple(found)
+
+
+def _fretted(voicing):
+    return [fret for fret in voicing if fret]
+
+
+def _position(voicing):
+    fretted = _fretted(voicing)
+    return min(fretted) if fretted else 0
+
+
+def _span(voicing):
+    fretted = _fretted(voicing)
+    return max(fretted) - min(fretted) if fretted else 0
+
+
+def _sounding(voicing):
+    return sum(fret is not None for fret in voicing)
+
+
+def voicing_midi(voicing, tuning=standard_tuning):
+    """MIDI notes of the sounding strings, low to high."""
+    return [open_midi + fret for (_, open_midi), fret in zip(tuning, voicing) if fret is not None]
+
+
+def format_voicing(voicing):
+    """Chord-chart notation, e.g. 'x32010'; frets above 9 switch to a dash-separated form."""
+    labels = ['x' if fret is None else str(fret) for fret in voicing]
+    return ('-' if any(len(label) > 1 for label in labels) else '').join(labels)
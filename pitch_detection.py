@@ -0,0 +1,151 @@
+"""
+Monophonic pitch detection for uploaded recordings.
+
+The WAV is memory-mapped (scipy.io.wavfile with mmap=True), cut into overlapping frames and
+processed a batch of frames at a time with a vectorized YIN: the difference function comes
+from an FFT autocorrelation of the whole batch, followed by the cumulative mean normalized
+difference and parabolic interpolation. Only one batch of frames is ever copied out of the
+file, so multi-minute recordings run in constant memory.
+"""
+import os
+import shutil
+import tempfile
+from collections import namedtuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import fft
+from scipy.io import wavfile
+
+from music_core.notes import chromatic_scale
+from music_core.tuning import A4_MIDI, DEFAULT_A4, standard_tuning
+
+
+FRAME_SIZE = 2048
+HOP_SIZE = 512
+FRAMES_PER_BATCH = 256
+YIN_THRESHOLD = 0.15
+SILENCE_RMS = 0.01
+MIN_FREQUENCY, MAX_FREQUENCY = 70.0, 1200.0  # low E (82 Hz) with room for detuning, up to fret ~22 on the high E
+
+PitchFrame = namedtuple('PitchFrame', ['time', 'frequency', 'midi'])
+NoteEvent = namedtuple('NoteEvent', ['start', 'end', 'midi', 'note', 'frequency'])
+
+
+def open_wav(source):
+    """Memory-maps a WAV from a path or an uploaded file object (copied to a temp file in chunks first)."""
+    if isinstance(source, str):
+        return wavfile.read(source, mmap=True)
+
+    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as copy:
+        shutil.copyfileobj(source, copy, length=2**20)
+    sample_rate, samples = wavfile.read(copy.name, mmap=True)
+    try:
+        os.unlink(copy.name)  # the mapping keeps the data alive on POSIX
+    except OSError:
+        pass
+    return sample_rate, samples
+
+
+def to_float_samples(frames):
+    """float32 samples in [-1, 1] from any WAV sample dtype (uint8 is offset binary)."""
+    if frames.dtype == np.uint8:
+        return (frames.astype(np.float32) - 128) / 128
+    if np.issubdtype(frames.dtype, np.integer):
+        return frames.astype(np.float32) / np.iinfo(frames.dtype).max
+    return frames.astype(np.float32)
+
+
+def yin(frames, sample_rate, threshold=YIN_THRESHOLD):
+    """Fundamental frequency per frame (rows of frames), 0 where no pitch is found."""
+    frame_size = frames.shape[1]
+    max_lag = min(frame_size // 2, int(sample_rate / MIN_FREQUENCY) + 2)
+    min_lag = max(2, int(sample_rate / MAX_FREQUENCY))
+    window = frame_size - max_lag  # YIN integration window
+
+    # Autocorrelation of every frame at once: r[t] = sum_j x[j] x[j + t] over the integration window
+    n_fft = fft.next_fast_len(frame_size + window)
+    spectrum_head = fft.rfft(frames[:, :window], n_fft, axis=1)
+    spectrum_full = fft.rfft(frames, n_fft, axis=1)
+    autocorrelation = fft.irfft(np.conj(spectrum_head) * spectrum_full, n_fft, axis=1)[:, :max_lag]
+
+    # d(t) = energy of the window + energy of the window shifted by t - 2 r(t)
+    squared_cumsum = np.concatenate((np.zeros((len(frames), 1), dtype=frames.dtype), np.cumsum(frames ** 2, axis=1)), axis=1)
+    head_energy = squared_cumsum[:, window:window + 1]
+    shifted_energy = squared_cumsum[:, window:window + max_lag] - squared_cumsum[:, :max_lag]
+    difference = head_energy + shifted_energy - 2 * autocorrelation
+    difference[:, 0] = 0
+
+    # Cumulative mean normalized difference
+    lags = np.arange(1, max_lag)
+    normalized = np.ones_like(difference)
+    running_mean = np.cumsum(difference[:, 1:], axis=1) / lags
+    normalized[:, 1:] = difference[:, 1:] / np.maximum(running_mean, 1e-12)
+
+    # First lag under the threshold that is also a local minimum
+    candidates = normalized[:, min_lag:-1]
+    dips = (candidates < threshold) & (normalized[:, min_lag + 1:] >= candidates)
+    found = dips.any(axis=1)
+    lag = dips.argmax(axis=1) + min_lag
+
+    # Parabolic interpolation around the chosen lag
+    rows = np.arange(len(frames))
+    previous_value = normalized[rows, lag - 1]
+    value = normalized[rows, lag]
+    next_value = normalized[rows, np.minimum(lag + 1, max_lag - 1)]
+    curvature = previous_value - 2 * value + next_value
+    shift = np.where(np.abs(curvature) > 1e-12, 0.5 * (previous_value - next_value) / np.where(curvature == 0, 1, curvature), 0)
+    refined_lag = lag + np.clip(shift, -1, 1)
+
+    return np.where(found, sample_rate / refined_lag, 0.0)
+
+
+def frequency_to_midi(frequency, a4=DEFAULT_A4):
+    return int(round(A4_MIDI + 12 * np.log2(frequency / a4)))
+
+
+def iter_pitch_frames(sample_rate, samples, frame_size=FRAME_SIZE, hop_size=HOP_SIZE, a4=DEFAULT_A4):
+    """Yields a PitchFrame per hop; frequency and midi are None for silent or unpitched frames."""
+    frames_per_batch_span = hop_size * (FRAMES_PER_BATCH - 1) + frame_size
+    for batch_start in range(0, max(len(samples) - frame_size + 1, 0), hop_size * FRAMES_PER_BATCH):
+        chunk = to_float_samples(samples[batch_start:batch_start + frames_per_batch_span])
+        if chunk.ndim > 1:
+            chunk = chunk.mean(axis=1)  # mono mix of just this chunk
+        frames = sliding_window_view(chunk, frame_size)[::hop_size]
+        frequencies = yin(frames, sample_rate)
+        loud = np.sqrt(np.mean(frames ** 2, axis=1)) >= SILENCE_RMS
+        for index, (frequency, voiced) in enumerate(zip(frequencies, loud)):
+            time = (batch_start + index * hop_size) / sample_rate
+            if voiced and frequency > 0:
+                yield PitchFrame(time, float(frequency), frequency_to_midi(frequency, a4))
+            else:
+                yield PitchFrame(time, None, None)
+
+
+def detect_notes(sample_rate, samples, min_duration=0.08, a4=DEFAULT_A4):
+    """Collapses consecutive frames with the same MIDI note into NoteEvents at least min_duration long."""
+    events = []
+    current = None  # [start, last time, midi, frequency sum, frame count]
+    for frame in iter_pitch_frames(sample_rate, samples, a4=a4):
+        if current and frame.midi == current[2]:
+            current[1] = frame.time
+            current[3] += frame.frequency
+            current[4] += 1
+            continue
+        if current:
+            events.append(current)
+        current = [frame.time, frame.time, frame.midi, frame.frequency, 1] if frame.midi is not None else None
+    if current:
+        events.append(current)
+
+    frame_duration = FRAME_SIZE / sample_rate
+    return [
+        NoteEvent(start, end + frame_duration, midi, chromatic_scale[midi % 12], total / count)
+        for start, end, midi, total, count in events
+        if end + frame_duration - start >= min_duration
+    ]
+
+
+def fretboard_positions(midi, tuning=standard_tuning, frets=15):
+    """Every (string name, fret) that plays this MIDI note."""
+    return [(string_name, midi - open_midi) for string_name, open_midi in tuning if 0 <= midi - open_midi < frets]
@@ -0,0 +1,82 @@
+"""
+Offline renderer that turns a whole chord progression into one audio buffer.
+
+Progressions resolve to roots and chord types through the cached parser in
+music_core.progressions. Each chord is voiced as MIDI notes, and the chord
+segments are synthesized and overlap-added with short linear crossfades. Segments render
+in-process by default; long or batch renders can pass workers to spread them over a process
+pool. Finished renders are cached per (progression, key, tempo, ...).
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from music_core.chords import chord_intervals
+from music_core.notes import note_index
+from music_core.progressions import progression_chords
+from music_core.tuning import DEFAULT_A4, midi_to_frequency
+from timbre import render_chord
+
+
+VOICINGS = ('close', 'open', 'bass')
+ROOT_OCTAVE_MIDI = 48  # C3: chord roots land between C3 and B3
+
+
+def chord_midi_notes(root_note, chord_type, voicing='close'):
+    """MIDI notes for a chord: close stacks the intervals, open raises every other tone an
+    octave, bass adds the root an octave below the close voicing."""
+    root_midi = ROOT_OCTAVE_MIDI + note_index[root_note]
+    intervals = chord_intervals[chord_type]
+    if voicing == 'close':
+        return [root_midi + interval for interval in intervals]
+    if voicing == 'open':
+        return [root_midi + interval + (12 if position % 2 else 0) for position, interval in enumerate(intervals)]
+    if voicing == 'bass':
+        return [root_midi - 12] + [root_midi + interval for interval in intervals]
+    raise ValueError(f"Unknown voicing {voicing!r}, expected one of {VOICINGS}")
+
+
+def _render_segment(job):
+    # Module-level so worker processes can unpickle it
+    frequencies, duration, timbre, sample_rate = job
+    return render_chord(frequencies, duration, timbre, sample_rate, amplitude=1 / len(frequencies), dtype=np.float32)
+
+
+@lru_cache(maxsize=32)
+def render_progression(progression, key, tempo=90, beats_per_chord=4, voicing='close', timbre='pluck',
+                       sample_rate=44100, crossfade=0.05, a4=DEFAULT_A4, workers=None):
+    """Read-only float32 buffer of the whole progression.
+
+    workers > 1 renders the chord segments in a process pool. The app leaves it serial: a
+    progression is only a handful of chords, cheaper to render than to start workers for."""
+    chords = progression_chords(progression, key)
+    hop = int(round(beats_per_chord * 60 / tempo * sample_rate))
+    fade = min(int(crossfade * sample_rate), hop)
+    # Each segment rings on for one crossfade past its slot so it can overlap the next chord
+    segment_duration = (hop + fade) / sample_rate
+
+    jobs = [
+        ([midi_to_frequency(midi, a4) for midi in chord_midi_notes(root, chord_type, voicing)], segment_duration, timbre, sample_rate)
+        for root, chord_type in chords
+    ]
+    if workers and workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            segments = list(pool.map(_render_segment, jobs))
+    else:
+        segments = [_render_segment(job) for job in jobs]
+
+    output = np.zeros(hop * len(segments) + fade, dtype=np.float32)
+    fade_in = np.linspace(0, 1, fade, endpoint=False, dtype=np.float32)
+    fade_out = 1 - fade_in  # the two ramps sum to one across each overlap
+    for position, segment in enumerate(segments):
+        segment = segment[:hop + fade]
+        if position > 0 and fade:
+            segment[:fade] *= fade_in
+        if position < len(segments) - 1 and fade:
+            segment[hop:hop + fade] *= fade_out
+        start = position * hop
+        output[start:start + len(segment)] += segment
+
+    output.setflags(write=False)
+    return output
@@ -0,0 +1,197 @@
+"""
+Command-line chord statistics for large progression corpora, no Streamlit needed.
+
+Reads a JSONL file (one {"progression": "I-vi-IV-V"} object or bare string per line) or a CSV
+with a progression column, lazily and in fixed-size chunks. Chunks are fanned out to a process
+pool with a bounded number in flight, so memory stays flat however big the file is. Every
+progression is transposed into all 12 keys and counted as chords, chord-to-chord transitions
+and chord tones. Each worker returns partial Counters that are merged as they complete.
+
+    python progression_corpus.py corpus.jsonl --top 20
+    python progression_corpus.py corpus.csv --column progression --json > stats.json
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+from itertools import islice
+
+from chord_index import chord_name
+from music_core.chords import calculate_chord_notes, get_chord_type_from_part, progression_to_root_notes
+from music_core.notes import chromatic_scale
+
+
+DEFAULT_CHUNK_SIZE = 2000
+
+
+def read_progressions(path, column='progression', input_format=None):
+    """Yields progression strings from a .jsonl or .csv file ('-' reads JSONL from stdin).
+
+    Malformed JSON lines and records without a string progression yield None, which analyze_chunk
+    counts as skipped.
+    """
+    input_format = input_format or ('csv' if path.lower().endswith('.csv') else 'jsonl')
+    stream = sys.stdin if path == '-' else open(path, newline='', encoding='utf-8')
+    try:
+        if input_format == 'csv':
+            for row in csv.DictReader(stream):
+                if row.get(column):
+                    yield row[column]
+        else:
+            for line in stream:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    yield None
+                    continue
+                progression = record.get(column) if isinstance(record, dict) else record
+                if progression != '':
+                    yield progression if isinstance(progression, str) else None
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def empty_stats():
+    return {'progressions': 0, 'skipped': 0, 'chords': Counter(), 'transitions': Counter(), 'notes': Counter()}
+
+
+@lru_cache(maxsize=None)
+def chord_tones(root, chord_type):
+    # Only 12 x chord types combinations exist, so each worker computes each one once
+    return calculate_chord_notes(root, chord_type)[0]
+
+
+@lru_cache(maxsize=4096)
+def progression_counts(progression):
+    """Chord, transition and chord-tone Counters for one progression summed over all 12 keys (read-only)."""
+    chord_types = [get_chord_type_from_part(part.strip()) for part in progression.split('-')]
+    chords = Counter()
+    transitions = Counter()
+    for key in chromatic_scale:
+        chord_pairs = list(zip(progression_to_root_notes(key, progression), chord_types))
+        chords.update(chord_pairs)
+        transitions.update(zip(chord_pairs, chord_pairs[1:]))
+
+    notes = Counter()
+    for (root, chord_type), count in chords.items():
+        for note in chord_tones(root, chord_type):
+            notes[note] += count
+    names = {chord: chord_name(*chord) for chord in chords}
+    return {
+        'chords': Counter({names[chord]: count for chord, count in chords.items()}),
+        'transitions': Counter({(names[before], names[after]): count for (before, after), count in transitions.items()}),
+        'notes': notes,
+    }
+
+
+def analyze_chunk(progressions):
+    """Partial statistics for one chunk, every progression counted once in each of the 12 keys."""
+    stats = empty_stats()
+    # Corpora repeat the same progressions a lot, so each distinct one is expanded once
+    for progression, occurrences in Counter(progressions).items():
+        if not isinstance(progression, str):
+            stats['skipped'] += occurrences
+            continue
+        try:
+            counts = progression_counts(progression)
+        except ValueError:
+            stats['skipped'] += occurrences
+            continue
+        stats['progressions'] += occurrences
+        for field, partial in counts.items():
+            total = stats[field]
+            for item, count in partial.items():
+                total[item] += count * occurrences
+    return stats
+
+
+def merge_stats(total, partial):
+    total['progressions'] += partial['progressions']
+    total['skipped'] += partial['skipped']
+    for field in ('chords', 'transitions', 'notes'):
+        total[field].update(partial[field])
+    return total
+
+
+def analyze_corpus(progressions, chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    """Merged statistics for an iterable of progression strings."""
+    workers = workers or os.cpu_count() or 1
+    total = empty_stats()
+    chunks = chunked(progressions, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            merge_stats(total, analyze_chunk(chunk))
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in chunks:
+            pending.add(pool.submit(analyze_chunk, chunk))
+            # Keep a couple of chunks queued per worker; reading waits until one finishes
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    merge_stats(total, future.result())
+        for future in pending:
+            merge_stats(total, future.result())
+    return total
+
+
+def summarize(stats, top=20):
+    return {
+        'progressions': stats['progressions'],
+        'skipped': stats['skipped'],
+        'chords': stats['chords'].most_common(top),
+        'transitions': [(f"{before} -> {after}", count) for (before, after), count in stats['transitions'].most_common(top)],
+        'notes': stats['notes'].most_common(top),
+    }
+
+
+def print_summary(summary, stream=sys.stdout):
+    print(f"{summary['progressions']} progressions in 12 keys ({summary['skipped']} skipped)", file=stream)
+    for title, field in (('Chords', 'chords'), ('Transitions', 'transitions'), ('Chord tones', 'notes')):
+        print(f"\n{title}:", file=stream)
+        for label, count in summary[field]:
+            print(f"  {label:<24} {count}", file=stream)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', help="JSONL or CSV file, or '-' for JSONL on stdin")
+    parser.add_argument('--format', choices=('jsonl', 'csv'), help='defaults to the file extension')
+    parser.add_argument('--column', default='progression', help='CSV column / JSON field holding the progression')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--workers', type=int, help='worker processes (defaults to the CPU count)')
+    parser.add_argument('--top', type=int, default=20, help='entries to report per statistic')
+    parser.add_argument('--json', action='store_true', help='print the summary as JSON')
+    args = parser.parse_args(argv)
+
+    progressions = read_progressions(args.path, args.column, args.format)
+    summary = summarize(analyze_corpus(progressions, args.chunk_size, args.workers), args.top)
+    if args.json:
+        json.dump(summary, sys.stdout, indent=2)
+        print()
+    else:
+        print_summary(summary, sys.stdout)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+Small content-keyed LRU cache for rendered images (PNG bytes, SVG text, ...).
+
+Streamlit reruns the whole script on every interaction, so plots that haven't changed get
+re-rendered over and over. Keeping the encoded output lets repeat views skip matplotlib.
+"""
+from collections import OrderedDict
+from threading import Lock
+
+
+class RenderCache:
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()  # Streamlit serves sessions from multiple threads
+
+    def get_or_render(self, key, render):
+        """Returns the cached output for key, calling render() and storing the result on a miss."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        output = render()
+
+        with self._lock:
+            self._entries[key] = output
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return output
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'maxsize': self.maxsize}
+
+    def __len__(self):
+        return len(self._entries)
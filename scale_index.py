@@ -0,0 +1,63 @@
+"""
+Inverted index for the scale finder.
+
+Built once at import, so every Streamlit session shares the same table. Each of the 4096
+pitch-class masks maps to the (root, mode) pairs whose scale contains it, turning
+"which scales contain these notes" into a single dictionary lookup.
+"""
+from music_core.notes import chromatic_scale, mode_intervals, note_index
+from music_core.pitch_masks import FULL_MASK, intervals_to_mask, mask_size
+
+
+# The scale finder also searches a couple of scales the mode explorer doesn't list
+finder_mode_intervals = dict(mode_intervals)
+finder_mode_intervals.update({
+    'Harmonic Minor': [0, 2, 3, 5, 7, 8, 11],
+    'Phrygian Dominant': [0, 1, 4, 5, 7, 8, 10],
+})
+
+# (root, mode) -> mask of the scale's pitch classes
+scale_masks = {
+    (root, mode): intervals_to_mask(intervals, note_index[root])
+    for root in chromatic_scale
+    for mode, intervals in finder_mode_intervals.items()
+}
+
+
+def _build_scale_index():
+    index = {mask: [] for mask in range(FULL_MASK + 1)}
+    for scale, scale_mask in scale_masks.items():
+        # Walk every sub-mask of the scale (2^7 for a heptatonic scale)
+        sub_mask = scale_mask
+        while True:
+            index[sub_mask].append(scale)
+            if sub_mask == 0:
+                break
+            sub_mask = (sub_mask - 1) & scale_mask
+    return {mask: tuple(scales) for mask, scales in index.items()}
+
+
+scale_index = _build_scale_index()
+
+
+def notes_to_mask(notes):
+    mask = 0
+    for note in notes:
+        mask |= 1 << note_index[note]
+    return mask
+
+
+def find_scales_for_notes(selected_notes):
+    """Returns (root, mode) pairs whose scale contains every selected note."""
+    return scale_index[notes_to_mask(selected_notes)]
+
+
+def find_scales_ranked(selected_notes):
+    """Like find_scales_for_notes, but as (root, mode, extra_note_count) with the tightest fits first."""
+    query_mask = notes_to_mask(selected_notes)
+    ranked = [
+        (root, mode, mask_size(scale_masks[(root, mode)] & ~query_mask))
+        for root, mode in scale_index[query_mask]
+    ]
+    ranked.sort(key=lambda match: match[2])
+    return ranked
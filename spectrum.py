@@ -0,0 +1,48 @@
+"""
+Spectrum and beat-frequency analysis of selected fretboard notes.
+
+Both results are cached per frequency set (order doesn't matter), so flipping between chords
+in the history only runs the FFT the first time a chord is analyzed.
+"""
+from functools import lru_cache
+
+import numpy as np
+from scipy import fft
+
+from synthesis import SineWave
+
+
+def _frequency_key(frequencies):
+    return tuple(sorted(round(float(frequency), 6) for frequency in frequencies))
+
+
+@lru_cache(maxsize=64)
+def _cached_spectrum(frequency_key, sample_rate, duration):
+    waves = [SineWave(frequency, sample_rate=sample_rate, duration=duration) for frequency in frequency_key]
+    signal = SineWave.combine_waves(waves)
+    window = np.hanning(len(signal))
+    signal *= window
+    # Scale so a full-amplitude sine shows up with a peak of ~1.0
+    magnitudes = np.abs(fft.rfft(signal)) * (2 / window.sum())
+    bin_frequencies = fft.rfftfreq(len(signal), 1 / sample_rate)
+    magnitudes.setflags(write=False)
+    bin_frequencies.setflags(write=False)
+    return bin_frequencies, magnitudes
+
+
+def compute_spectrum(frequencies, sample_rate=44100, duration=1):
+    """Returns (bin frequencies in Hz, magnitudes) of the combined signal, Hann-windowed."""
+    return _cached_spectrum(_frequency_key(frequencies), sample_rate, duration)
+
+
+@lru_cache(maxsize=256)
+def _cached_beats(frequency_key):
+    frequencies = np.array(frequency_key)
+    differences = np.abs(frequencies[:, None] - frequencies[None, :])
+    low, high = np.triu_indices(len(frequencies), k=1)
+    return tuple(zip(frequencies[low].tolist(), frequencies[high].tolist(), differences[low, high].tolist()))
+
+
+def beat_frequencies(frequencies):
+    """Every pair of distinct notes as (lower Hz, higher Hz, beat Hz); a pitch played on two strings counts once."""
+    return _cached_beats(tuple(sorted(set(_frequency_key(frequencies)))))
@@ -0,0 +1,121 @@
+"""
+Tone synthesis for the FREQ page.
+
+SineWave keeps its original whole-buffer API (.time, .wave, combine_waves) for plotting, but
+the arrays are only built on first access and come from a wavetable oscillator with a
+per-note LRU cache, so repeating a chord costs a lookup plus an add. stream_combined mixes
+any number of notes block by block into one preallocated buffer, so long durations and big
+chords use constant memory and a consumer can start playing or writing before synthesis
+finishes.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+
+DEFAULT_BLOCK_SIZE = 4096
+WAVETABLE_SIZE = 4096  # linear interpolation error stays below 1e-6 at this size
+
+
+@lru_cache(maxsize=None)
+def sine_wavetable(size=WAVETABLE_SIZE):
+    """One cycle of a sine with a guard sample at the end so interpolation never wraps."""
+    table = np.sin(2 * np.pi * np.arange(size + 1) / size)
+    table.setflags(write=False)
+    return table
+
+
+def wavetable_oscillator(frequency, sample_indices, sample_rate, phase=0.0, out=None, size=WAVETABLE_SIZE):
+    """Reads the sine table at the given sample indices with a fixed phase increment per sample."""
+    table = sine_wavetable(size)
+    position = np.multiply(sample_indices, frequency / sample_rate * size, out=out)
+    np.add(position, phase / (2 * np.pi) * size, out=position)
+    np.mod(position, size, out=position)
+    index = position.astype(np.intp)
+    np.subtract(position, index, out=position)  # position now holds the fractional part
+    low = table[index]
+    # low + (high - low) * frac, without another full-size temporary for high
+    np.multiply(position, table[index + 1] - low, out=position)
+    np.add(position, low, out=position)
+    return position
+
+
+# ~78 distinct pitches on the fretboard, so this holds every note of a typical session
+@lru_cache(maxsize=96)
+def note_waveform(frequency, amplitude, phase, sample_rate, num_samples):
+    """Cached, read-only waveform for one note."""
+    wave = wavetable_oscillator(frequency, np.arange(num_samples, dtype=np.float64), sample_rate, phase)
+    if amplitude != 1.0:
+        wave *= amplitude
+    wave.setflags(write=False)
+    return wave
+
+
+class SineWave:
+    def __init__(self, frequency, amplitude=1.0, phase=0.0, sample_rate=44100, duration=1):
+        self.frequency = frequency
+        self.amplitude = amplitude
+        self.phase = phase
+        self.sample_rate = sample_rate
+        self.duration = duration
+        self._time = None
+        self._wave = None
+
+    @property
+    def num_samples(self):
+        # Same length np.arange(0, duration, 1 / sample_rate) produces
+        return int(np.ceil(self.duration * self.sample_rate))
+
+    @property
+    def time(self):
+        if self._time is None:
+            self._time = np.arange(self.num_samples) / self.sample_rate
+        return self._time
+
+    @property
+    def wave(self):
+        if self._wave is None:
+            self._wave = self.generate_wave()
+        return self._wave
+
+    def generate_wave(self):
+        return note_waveform(self.frequency, self.amplitude, self.phase, self.sample_rate, self.num_samples)
+
+    def add_block(self, out, start, ramp, scratch):
+        """Adds samples [start, start + len(out)) of this wave into out; ramp is 0..n-1, scratch is work space."""
+        count = len(out)
+        scratch = scratch[:count]
+        np.add(ramp[:count], start, out=scratch)
+        wavetable_oscillator(self.frequency, scratch, self.sample_rate, self.phase, out=scratch)
+        np.multiply(scratch, self.amplitude, out=scratch)
+        np.add(out, scratch, out=out)
+
+    @staticmethod
+    def combine_waves(waves):
+        # Accumulate in place instead of stacking every wave into a 2-D array first
+        combined_wave = np.zeros(max(wave.num_samples for wave in waves))
+        for wave in waves:
+            combined_wave[:wave.num_samples] += wave.wave
+        return combined_wave
+
+    @staticmethod
+    def stream_combined(waves, block_size=DEFAULT_BLOCK_SIZE, dtype=np.float64):
+        """
+        Yields the mixed signal in blocks of at most block_size samples.
+
+        The same buffer is reused for every block, so copy a block if you need to keep it.
+        """
+        total = max(wave.num_samples for wave in waves)
+        block = np.empty(block_size, dtype=dtype)
+        scratch = np.empty(block_size, dtype=dtype)
+        ramp = np.arange(block_size, dtype=dtype)
+        for start in range(0, total, block_size):
+            count = min(block_size, total - start)
+            out = block[:count]
+            out.fill(0)
+            for wave in waves:
+                active = min(count, wave.num_samples - start)
+                if active <= 0:
+                    continue
+                wave.add_block(out[:active], start, ramp, scratch)
+            yield out
@@ -0,0 +1,75 @@
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from audio_export import HEADROOM, PCM_MAX, render_waves_wav, write_wav
+from synthesis import SineWave
+
+
+def read_wav(data):
+    with wave.open(io.BytesIO(data), 'rb') as wav_file:
+        params = wav_file.getparams()
+        samples = np.frombuffer(wav_file.readframes(params.nframes), dtype='<i2')
+    return params, samples
+
+
+def test_write_wav_returns_bytes_with_mono_16_bit_header():
+    tone = np.sin(np.linspace(0, 20 * np.pi, 4410))
+    data = write_wav(lambda: [tone.copy()], 44100, seed=0)
+
+    assert isinstance(data, bytes)
+    params, samples = read_wav(data)
+    assert (params.nchannels, params.sampwidth, params.framerate, params.nframes) == (1, 2, 44100, 4410)
+    assert abs(int(np.abs(samples).max()) - HEADROOM * PCM_MAX) <= 2
+
+
+def test_write_wav_streams_several_blocks():
+    blocks = [np.full(1000, 0.5), np.full(500, -1.0)]
+    data = write_wav(lambda: [block.copy() for block in blocks], 8000, dither=False)
+
+    _, samples = read_wav(data)
+    assert len(samples) == 1500
+    assert samples[0] == round(0.5 * HEADROOM * PCM_MAX)
+    assert samples[-1] == -round(HEADROOM * PCM_MAX)
+
+
+def test_write_wav_accepts_read_only_blocks():
+    block = np.linspace(-1, 1, 100, dtype=np.float32)
+    block.setflags(write=False)
+    _, samples = read_wav(write_wav(lambda: [block], 8000, dither=False))
+    assert len(samples) == 100
+
+
+def test_write_wav_silence_stays_silent_without_dither():
+    _, samples = read_wav(write_wav(lambda: [np.zeros(256)], 8000, dither=False))
+    assert not samples.any()
+
+
+def test_write_wav_is_deterministic_for_a_seed():
+    make_blocks = lambda: [np.sin(np.arange(2000) / 10.0)]
+    assert write_wav(make_blocks, 8000, seed=3) == write_wav(make_blocks, 8000, seed=3)
+
+
+def test_render_waves_wav_matches_duration():
+    waves = [SineWave(440, duration=0.25), SineWave(660, duration=0.25)]
+    params, _ = read_wav(render_waves_wav(waves, seed=0))
+    assert params.nframes == waves[0].num_samples
+
+
+def test_write_wav_output_is_accepted_by_st_audio():
+    pytest.importorskip('streamlit')
+    from streamlit.testing.v1 import AppTest
+
+    def audio_page():
+        import numpy as np
+        import streamlit as st
+
+        from audio_export import write_wav
+
+        tone = np.sin(np.linspace(0, 200 * np.pi, 8000))
+        st.audio(write_wav(lambda: [tone.copy()], 8000, seed=0), format='audio/wav')
+
+    app = AppTest.from_function(audio_page).run()
+    assert not app.exception
@@ -0,0 +1,38 @@
+import numpy as np
+
+from chord_batch import (
+    batch_chord_names,
+    batch_chord_notes,
+    chord_catalog,
+    chord_sizes,
+    chord_type_ids,
+    chord_type_names,
+    max_chord_size,
+)
+from music_core.chords import calculate_chord_notes, chord_intervals
+from music_core.notes import chromatic_scale
+
+
+def test_every_chord_matches_calculate_chord_notes():
+    roots, type_ids = np.meshgrid(np.arange(12), np.arange(len(chord_type_names)), indexing='ij')
+    pitch_classes, intervals = batch_chord_notes(roots.ravel(), type_ids.ravel())
+    names = batch_chord_names(pitch_classes, intervals)
+
+    for (notes, degrees), root, type_id in zip(names, roots.ravel(), type_ids.ravel()):
+        assert (notes, degrees) == calculate_chord_notes(chromatic_scale[root], chord_type_names[type_id])
+
+
+def test_short_chords_are_padded():
+    pitch_classes, intervals = batch_chord_notes([0, 9], [chord_type_ids['power'], chord_type_ids['minor']])
+    assert pitch_classes.shape == intervals.shape == (2, max_chord_size)
+    assert pitch_classes[0].tolist() == [0, 7] + [-1] * (max_chord_size - 2)
+    assert pitch_classes[1].tolist() == [9, 0, 4] + [-1] * (max_chord_size - 3)
+    assert intervals[0].tolist() == [0, 7] + [-1] * (max_chord_size - 2)
+    assert batch_chord_names(pitch_classes, intervals)[0] == (['C', 'G'], ['R', '5'])
+
+
+def test_catalog_shape_and_sizes():
+    assert chord_catalog.shape == (12, len(chord_intervals), max_chord_size)
+    assert chord_sizes.tolist() == [len(intervals) for intervals in chord_intervals.values()]
+    assert not chord_catalog.flags.writeable
+    assert batch_chord_notes([14], [chord_type_ids['major']])[0][0].tolist()[:3] == [2, 6, 9]  # roots wrap mod 12
@@ -0,0 +1,39 @@
+from chord_index import chord_index, chord_name, identify_chords
+
+
+def names(selected_notes, bass=None):
+    return [match.name for match in identify_chords(selected_notes, bass)]
+
+
+def test_root_position():
+    match = identify_chords(['C', 'E', 'G'])[0]
+    assert (match.root, match.chord_type, match.inversion, match.name) == ('C', 'major', 0, 'C')
+
+
+def test_inversion_named_over_its_bass():
+    first = identify_chords(['E', 'G', 'C'])[0]
+    assert (first.name, first.inversion) == ('C/E', 1)
+
+
+def test_identical_pitch_classes_ranked_by_bass():
+    assert names(['A', 'C', 'E', 'G'])[0] == 'Am7'
+    assert names(['C', 'E', 'G', 'A'])[0] == 'C6'
+    assert names(['A', 'C', 'E', 'G'], bass='C')[0] == 'C6'
+
+
+def test_slash_chord_over_non_chord_bass():
+    matches = identify_chords(['C', 'D', 'F#/Gb', 'A'])
+    assert 'D/C' in [match.name for match in matches]
+    assert next(match for match in matches if match.name == 'D/C').inversion is None
+
+
+def test_unknown_and_empty():
+    assert identify_chords([]) == []
+    assert names(['C', 'C#/Db', 'D']) == []
+
+
+def test_index_and_names():
+    assert ('C', 'major') in chord_index[0b000010010001]  # C, E, G
+    assert chord_name('A', 'minor_7th') == 'Am7'
+    assert chord_name('C', 'major', 'E') == 'C/E'
+    assert chord_name('C', 'major', 'C') == 'C'
@@ -0,0 +1,102 @@
+import os
+import time
+
+import numpy as np
+import pytest
+
+import chord_recognition
+from audio_export import write_wav
+from chord_recognition import NO_CHORD_LABEL, chord_templates, recognize_chords, state_label, state_spellings
+from music_core.tuning import midi_to_frequency
+from timbre import render_chord
+
+
+SAMPLE_RATE = 44100
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+
+
+def synthesize(midi_notes, timbre, duration=2.0):
+    frequencies = [midi_to_frequency(midi) for midi in midi_notes]
+    return render_chord(frequencies, duration, timbre, SAMPLE_RATE, amplitude=0.2).astype(np.float32)
+
+
+@pytest.mark.parametrize('midi_notes, timbre, expected', [
+    ([48, 52, 55], 'saw', 'C'),
+    ([57, 60, 64], 'square', 'Am'),
+    ([40, 47, 52, 55, 59, 64], 'pluck', 'Em'),
+    ([40, 47, 52, 55, 59, 64], 'saw', 'Em'),
+    ([41, 48, 53, 57, 60, 65], 'pluck', 'F'),
+    ([50, 54, 57], 'sine', 'D'),
+    ([47, 50, 53], 'saw', 'Bdim'),
+    ([43, 47, 50, 53, 55, 59], 'pluck', 'G7'),
+    ([48, 52, 55, 59], 'saw', 'CM7'),
+    ([45, 52, 57, 62, 64], 'saw', 'Asus4'),
+    ([40, 47, 52], 'saw', 'EP'),
+])
+def test_synthesized_chords(midi_notes, timbre, expected):
+    segments = recognize_chords(SAMPLE_RATE, synthesize(midi_notes, timbre))
+    assert segments[0].label == expected
+    assert segments[0].start == 0
+
+
+@pytest.mark.parametrize('midi_notes, expected', [
+    ([45, 52, 55, 60, 64], 'Am7'),
+    ([48, 52, 55, 57, 64], 'C6'),
+])
+def test_bass_names_identical_pitch_class_sets(midi_notes, expected):
+    assert [segment.label for segment in recognize_chords(SAMPLE_RATE, synthesize(midi_notes, 'saw'))] == [expected]
+
+
+def test_identical_templates_share_one_state():
+    assert len(chord_templates) == len(state_spellings)
+    am7_state = next(state for state, spellings in enumerate(state_spellings) if (9, 'minor_7th') in spellings)
+    assert state_spellings[am7_state] == [(9, 'minor_7th'), (0, '6th')]
+    # Without a matching bass the earlier chord_intervals entry names the state
+    assert state_label(am7_state) == 'Am7'
+    assert state_label(am7_state, bass_pitch_class=0) == 'C6'
+    assert state_label(len(state_spellings)) == NO_CHORD_LABEL
+
+
+def test_progression_with_silence_faster_than_realtime():
+    chords = [([48, 52, 55], 'C'), ([45, 52, 57, 60, 64], 'Am'), ([41, 48, 53, 57, 60, 65], 'F')]
+    samples = np.concatenate([synthesize(midi_notes, 'pluck') for midi_notes, _ in chords] + [np.zeros(SAMPLE_RATE, np.float32)])
+
+    start = time.perf_counter()
+    segments = recognize_chords(SAMPLE_RATE, samples)
+    elapsed = time.perf_counter() - start
+
+    labels = [segment.label for segment in segments if segment.label != NO_CHORD_LABEL]
+    assert labels == [label for _, label in chords]
+    assert segments[-1].label == NO_CHORD_LABEL
+    assert elapsed < len(samples) / SAMPLE_RATE
+
+
+def test_too_short_input():
+    assert recognize_chords(SAMPLE_RATE, np.zeros(100, np.float32)) == []
+
+
+def test_recognition_runs_once_per_upload(monkeypatch):
+    pytest.importorskip('streamlit')
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    calls = []
+
+    def counting_recognize_chords(*args, **kwargs):
+        calls.append(args[0])
+        return recognize_chords(*args, **kwargs)
+
+    monkeypatch.setattr(chord_recognition, 'recognize_chords', counting_recognize_chords)
+    st.cache_data.clear()
+    recording = write_wav(lambda: [synthesize([48, 52, 55], 'saw')], SAMPLE_RATE, dither=False)
+
+    app = AppTest.from_file(APP, default_timeout=120).run()
+    app.checkbox(key='recognize_chords_from_recording').check().run()
+    app.get('file_uploader')[0].set_value(('chords.wav', recording, 'audio/wav')).run()
+    assert not app.exception
+    assert list(app.table[0].value['Chord']) == ['C']
+
+    # Other widgets rerun the script with the same upload; the chromagram is not recomputed
+    app.checkbox(key='show_borrowed_chords').check().run()
+    assert not app.exception
+    assert len(calls) == 1
@@ -0,0 +1,37 @@
+import os
+
+import numpy as np
+import pytest
+
+from chords import calculate_chord_notes
+from circle_of_fifths import circle_x, circle_y, render_circle_png, render_circle_svg
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+
+
+def test_positions_are_rotations_of_one_circle():
+    assert circle_x.shape == circle_y.shape == (12, 12)
+    np.testing.assert_allclose(np.hypot(circle_x, circle_y), 1.15)
+    np.testing.assert_allclose(circle_x[1], np.roll(circle_x[0], 1))
+
+
+def test_renders():
+    notes, degrees = calculate_chord_notes('G', 'dominant_7th')
+    assert render_circle_png('G', notes, degrees).startswith(b'\x89PNG')
+    svg = render_circle_svg('G', notes, degrees)
+    assert svg.startswith('<svg') and all(note in svg for note in notes)
+
+
+@pytest.mark.parametrize('renderer, element', [('PNG', 'image'), ('SVG', 'markdown')])
+def test_circle_in_app(renderer, element):
+    pytest.importorskip('streamlit')
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(APP, default_timeout=120).run()
+    app.selectbox(key='render_backend_select').select(renderer)
+    app.checkbox(key='show_circle_of_fifths').check().run()
+
+    assert not app.exception
+    assert app.get(element)
+    if renderer == 'PNG':
+        assert len(app.get('image')) == 1
@@ -0,0 +1,43 @@
+import os
+
+import numpy as np
+import pytest
+
+import pitch_detection
+from audio_export import write_wav
+from music_core.tuning import midi_to_frequency
+
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+
+
+def riff_wav(sample_rate=22050):
+    tones = [np.sin(2 * np.pi * midi_to_frequency(midi) * np.arange(sample_rate // 2) / sample_rate) for midi in (45, 52, 57)]
+    return write_wav(lambda: [0.5 * np.concatenate(tones)], sample_rate, dither=False)
+
+
+def test_detection_runs_once_per_upload(monkeypatch):
+    pytest.importorskip('streamlit')
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    calls = []
+
+    def counting_detect_notes(*args, **kwargs):
+        calls.append(args[0])
+        return detect_notes(*args, **kwargs)
+
+    detect_notes = pitch_detection.detect_notes
+    monkeypatch.setattr(pitch_detection, 'detect_notes', counting_detect_notes)
+    st.cache_data.clear()
+
+    app = AppTest.from_file(APP, default_timeout=120).run()
+    app.checkbox(key='detect_notes_from_recording').check().run()
+    app.get('file_uploader')[0].set_value(('riff.wav', riff_wav(), 'audio/wav')).run()
+    assert not app.exception
+    assert list(app.table[0].value['Note']) == ['A', 'E', 'A']
+
+    # Any other widget change reruns the script; the uploaded bytes are unchanged, so no new YIN pass
+    app.checkbox(key='show_borrowed_chords').check().run()
+    assert not app.exception
+    assert len(calls) == 1
@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from downsample import minmax_decimate
+
+
+@pytest.mark.parametrize('count, max_points', [(100_000, 4000), (44_100, 4000), (10_007, 1000), (4001, 4000)])
+def test_envelope_keeps_extremes_within_budget(count, max_points):
+    rng = np.random.default_rng(count)
+    signal = rng.standard_normal(count)
+    indices, values = minmax_decimate(signal, max_points)
+
+    assert len(indices) <= max_points + 2  # plus at most the tail bucket's two points
+    assert np.all(np.diff(indices) > 0)
+    np.testing.assert_array_equal(values, signal[indices])
+    assert signal.argmin() in indices and signal.argmax() in indices
+
+
+def test_tail_bucket_is_included():
+    signal = np.zeros(1003)
+    signal[-1] = 5.0  # only in the samples left over after the equal buckets
+    signal[-2] = -3.0
+    indices, values = minmax_decimate(signal, max_points=100)
+    assert indices[-2:].tolist() == [1001, 1002]
+    assert values.max() == 5.0 and values.min() == -3.0
+
+
+def test_short_signal_is_returned_whole():
+    signal = np.arange(10.0)
+    indices, values = minmax_decimate(signal, max_points=100)
+    np.testing.assert_array_equal(indices, np.arange(10))
+    np.testing.assert_array_equal(values, signal)
@@ -0,0 +1,58 @@
+import os
+
+import pytest
+
+from chords import calculate_chord_notes, earth_note_colors
+from circle_of_fifths import render_circle_png
+from figure_manager import FigureManager, figure_manager
+from fretboard_visual import render_fretboard_png
+
+FREQ_PAGE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fretboard_select_FREQ.py')
+
+
+def test_figures_return_to_the_pool():
+    manager = FigureManager(max_pooled_per_size=1)
+    with manager.figure((4, 3)) as first:
+        first.add_subplot().plot([0, 1], [1, 0])
+        assert manager.stats()['in_use'] == 1
+    with manager.figure((4, 3)) as second:
+        assert second is first
+        assert not second.axes  # cleared before reuse
+    with manager.figure((4, 3)) as outer, manager.figure((4, 3)) as inner:
+        assert inner is not outer
+
+    stats = manager.stats()
+    assert (stats['created'], stats['in_use'], stats['pooled']) == (2, 0, 1)
+
+
+def test_figure_returned_when_the_block_raises():
+    manager = FigureManager()
+    with pytest.raises(RuntimeError):
+        with manager.figure((4, 3)):
+            raise RuntimeError
+    assert manager.stats()['in_use'] == 0
+    assert manager.stats()['pooled'] == 1
+
+
+def test_renders_leave_nothing_open():
+    notes, degrees = calculate_chord_notes('D', 'minor')
+    for _ in range(3):
+        render_circle_png('D', notes, degrees)
+        render_fretboard_png(earth_note_colors, notes, degrees)
+    stats = figure_manager.stats()
+    assert stats['in_use'] == 0
+    assert stats['pyplot_open'] == 0
+
+
+def test_freq_combined_wave_plot():
+    pytest.importorskip('streamlit')
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(FREQ_PAGE, default_timeout=60).run()
+    app.button(key='button_A_3').click().run()
+    app.button(key='button_E_high_0').click().run()
+    next(button for button in app.button if button.label == 'Generate Combined Wave').click().run()
+
+    assert not app.exception
+    assert len(app.get('image')) == 1
+    assert figure_manager.stats()['in_use'] == 0
@@ -0,0 +1,42 @@
+import os
+
+import pytest
+
+pytest.importorskip('streamlit')
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+FREQ_PAGE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fretboard_select_FREQ.py')
+
+
+def test_drop_d_low_string_is_named_d():
+    app = AppTest.from_file(FREQ_PAGE, default_timeout=60).run()
+    app.selectbox(key='tuning_select').select('Drop D').run()
+    app.button(key='button_D_low_0').click().run()
+
+    assert not app.exception
+    assert app.session_state['selected_notes'][0]['string'] == 'D_low'
+    assert app.session_state['selected_notes'][0]['note'] == 'D'
+
+
+@pytest.mark.parametrize('timbre', ['sine', 'saw', 'square', 'pluck'])
+def test_render_audio_plays_every_timbre(timbre):
+    app = AppTest.from_file(FREQ_PAGE, default_timeout=60).run()
+    app.button(key='button_A_3').click().run()  # C on the A string
+    app.button(key='button_E_high_0').click().run()
+    app.selectbox(key='audio_timbre').select(timbre)
+    app.number_input(key='audio_duration').set_value(0.5)
+    next(button for button in app.button if button.label == 'Render Audio').click().run()
+
+    assert not app.exception
+    assert len(app.get('audio')) == 1
+
+
+def test_spectrum_panel_lists_each_pitch_pair_once():
+    app = AppTest.from_file(FREQ_PAGE, default_timeout=60).run()
+    for key in ('button_A_3', 'button_B_5', 'button_E_high_0'):  # C4 plus E4 on two strings
+        app.button(key=key).click().run()
+    app.checkbox(key='show_spectrum').check().run()
+
+    assert not app.exception
+    assert len(app.get('image')) == 1
+    assert len(app.table[0].value) == 1
@@ -0,0 +1,36 @@
+import re
+
+import pytest
+
+from chords import _light_note_colors, calculate_chord_notes, earth_note_colors
+from fretboard_svg import render_fretboard_svg, string_order
+from note_sets import guitar_strings_standard
+
+
+def chord_tone_positions(chord_notes, frets):
+    return [
+        (string_name, fret)
+        for string_name in string_order
+        for fret in range(frets)
+        if guitar_strings_standard[string_name][fret % 12] in chord_notes
+    ]
+
+
+@pytest.mark.parametrize('palette', [earth_note_colors, _light_note_colors])
+@pytest.mark.parametrize('root_note, chord_type', [('C', 'major'), ('A', 'minor_7th'), ('F#/Gb', 'diminished')])
+def test_one_label_per_chord_tone_position(palette, root_note, chord_type):
+    notes, degrees = calculate_chord_notes(root_note, chord_type)
+    svg = render_fretboard_svg(palette, notes, degrees)
+
+    fills = re.findall(r'<rect [^>]*fill="([^"]+)"', svg)
+    assert len(fills) == len(chord_tone_positions(notes, 15))
+    assert set(fills) == {palette[note] for note in notes}
+    assert svg.startswith('<svg') and svg.endswith('</svg>')
+
+
+def test_degree_labels_and_fret_count():
+    notes, degrees = calculate_chord_notes('C', 'major')
+    svg = render_fretboard_svg(earth_note_colors, notes, degrees, show_degrees=True, frets=5)
+    labels = re.findall(r'<text [^>]*>([^<]*)</text>', svg)
+    assert sorted(set(labels)) == sorted(degrees)
+    assert len(labels) == len(chord_tone_positions(notes, 5))
@@ -0,0 +1,30 @@
+import os
+
+import pytest
+
+from chords import calculate_chord_notes, earth_note_colors
+from fretboard_visual import fretboard_render_cache, render_fretboard_png
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+
+
+def test_render_fretboard_png():
+    notes, degrees = calculate_chord_notes('C', 'major')
+    png = render_fretboard_png(earth_note_colors, notes, degrees, show_degrees=True)
+    assert png.startswith(b'\x89PNG')
+
+
+def test_fretboard_in_app_is_cached_across_reruns():
+    pytest.importorskip('streamlit')
+    from streamlit.testing.v1 import AppTest
+
+    fretboard_render_cache.clear()
+    app = AppTest.from_file(APP, default_timeout=120).run()
+    app.selectbox(key='render_backend_select').select('PNG')
+    app.checkbox(key='guitar_fretboard_visualization').check().run()
+    app.run()
+
+    assert not app.exception
+    assert len(app.get('image')) == 1
+    assert fretboard_render_cache.stats()['misses'] == 1
+    assert fretboard_render_cache.stats()['hits'] >= 1
@@ -0,0 +1,24 @@
+import compileall
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'benchmarks'))
+
+from import_budget import DEFAULT_BUDGET_MS, FORBIDDEN_MODULES, measure_import  # noqa: E402
+
+
+def test_music_core_does_not_load_ui_or_plotting_packages():
+    code = 'import sys, music_core; print("\\n".join(sys.modules))'
+    result = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    loaded = {name.split('.')[0] for name in result.stdout.split()}
+    assert not loaded.intersection(FORBIDDEN_MODULES)
+
+
+def test_music_core_import_within_budget():
+    # The budget is for a deployed app with bytecode on disk, not for compiling the sources,
+    # which PYTHONDONTWRITEBYTECODE would otherwise force on every run
+    compileall.compile_dir(os.path.join(REPO_ROOT, 'music_core'), quiet=1)
+    cumulative_us, _ = measure_import('music_core')
+    assert cumulative_us <= DEFAULT_BUDGET_MS * 1000
@@ -0,0 +1,56 @@
+from unittest import mock
+
+import music_core.chords as chords
+from music_core.chords import chord_intervals, chord_masks, find_related_chords_and_notes_categorized
+from music_core.pitch_masks import (
+    intervals_to_mask,
+    is_subset,
+    is_superset,
+    mask_size,
+    mask_to_pitch_classes,
+    transpose_mask,
+)
+from scale_index import find_scales_for_notes, find_scales_ranked, scale_index
+
+
+def test_intervals_to_mask_wraps_octaves():
+    assert intervals_to_mask([0, 4, 7]) == 0b10010001
+    assert intervals_to_mask([0, 4, 7, 14]) == intervals_to_mask([0, 2, 4, 7])
+    assert mask_to_pitch_classes(intervals_to_mask([0, 4, 7], root=9)) == [1, 4, 9]
+
+
+def test_transpose_and_subset():
+    major = chord_masks['major']
+    assert transpose_mask(major, 12) == major
+    assert mask_to_pitch_classes(transpose_mask(major, 11)) == [3, 6, 11]
+    assert is_subset(major, chord_masks['major_7th'])
+    assert is_superset(chord_masks['dominant_7th'], major)
+    assert mask_size(chord_masks['diminished_7th']) == 4
+
+
+def test_related_chords_categories():
+    related = find_related_chords_and_notes_categorized('major', chord_intervals, 'C')
+    assert 'dominant_7th' in related['Superset']
+    assert 'power' in related['Subset']
+    assert 'minor' in related['Shares common intervals with']
+    assert related['Superset']['major_7th'] == (['C', 'E', 'G', 'B'], ['R', '3', '5', '7'])
+
+
+def test_related_chords_reuse_module_masks():
+    with mock.patch.object(chords, 'intervals_to_mask', side_effect=AssertionError('masks rebuilt')):
+        find_related_chords_and_notes_categorized('minor', chord_intervals, 'A')
+
+
+def test_related_chords_with_custom_table():
+    table = {chord: chord_intervals[chord] for chord in ('major', 'minor', 'major_7th')}
+    related = find_related_chords_and_notes_categorized('major', table, 'C')
+    assert list(related['Superset']) == ['major_7th']
+    assert list(related['Shares common intervals with']) == ['minor']
+    assert not related['Subset']
+
+
+def test_scale_index_covers_every_mask():
+    assert len(scale_index) == 4096
+    assert ('C', 'Ionian') in find_scales_for_notes(['C', 'E', 'G'])
+    assert ('C', 'Ionian') not in find_scales_for_notes(['C', 'E', 'G#/Ab'])
+    assert find_scales_ranked(['C', 'D', 'E', 'F', 'G', 'A', 'B'])[0][2] == 0
@@ -0,0 +1,49 @@
+import os
+
+import numpy as np
+import pytest
+
+from progression_audio import chord_midi_notes, progression_chords, render_progression
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+
+
+def test_chord_midi_notes_voicings():
+    assert chord_midi_notes('C', 'major') == [48, 52, 55]
+    assert chord_midi_notes('C', 'major', 'open') == [48, 64, 55]
+    assert chord_midi_notes('C', 'major', 'bass') == [36, 48, 52, 55]
+    with pytest.raises(ValueError):
+        chord_midi_notes('C', 'major', 'spread')
+
+
+def test_progression_chords():
+    assert progression_chords('ii7-V7-Imaj7', 'C') == [('D', 'minor_7th'), ('G', 'dominant_7th'), ('C', 'major_7th')]
+
+
+def test_render_progression_length_and_caching():
+    samples = render_progression('I-IV-V', 'C', tempo=240, beats_per_chord=1, timbre='sine', sample_rate=8000)
+    hop = 2000  # one beat at 240 BPM
+    assert samples.dtype == np.float32
+    assert len(samples) == 3 * hop + int(0.05 * 8000)
+    assert not samples.flags.writeable
+    assert np.abs(samples).max() > 0.1
+    assert render_progression('I-IV-V', 'C', tempo=240, beats_per_chord=1, timbre='sine', sample_rate=8000) is samples
+
+
+def test_worker_pool_matches_serial_render():
+    serial = render_progression('I-vi-IV-V', 'G', tempo=240, beats_per_chord=1, timbre='saw', sample_rate=8000)
+    pooled = render_progression('I-vi-IV-V', 'G', tempo=240, beats_per_chord=1, timbre='saw', sample_rate=8000, workers=2)
+    assert pooled is not serial
+    np.testing.assert_array_equal(pooled, serial)
+
+
+def test_play_progression_audio_in_app():
+    pytest.importorskip('streamlit')
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(APP, default_timeout=120).run()
+    app.checkbox(key='chord_progression_GO').check().run()
+    app.checkbox(key='progression_audio').check().run()
+
+    assert not app.exception
+    assert len(app.get('audio')) == 1
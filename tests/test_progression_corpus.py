@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from progression_corpus import analyze_corpus, main, progression_counts, read_progressions
+
+
+def write_lines(path, lines):
+    path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    return str(path)
+
+
+def run_json(capsys, argv):
+    assert main(argv) == 0
+    return json.loads(capsys.readouterr().out)
+
+
+def test_progression_counts_cover_all_keys():
+    counts = progression_counts('I-IV-V')
+    assert sum(counts['chords'].values()) == 36
+    assert counts['chords']['C'] == 3  # tonic in C, subdominant in G, dominant in F
+    assert sum(counts['transitions'].values()) == 24
+    assert counts['transitions'][('C', 'F')] == 1
+
+
+def test_jsonl_cli(tmp_path, capsys):
+    path = write_lines(tmp_path / 'corpus.jsonl', [
+        '{"progression": "I-vi-IV-V"}',
+        '"ii-V-I"',
+        '',
+        '{"progression": "I-vi-IV-V"}',
+    ])
+    summary = run_json(capsys, [path, '--json', '--workers', '1'])
+    assert summary['progressions'] == 3
+    assert summary['skipped'] == 0
+    assert dict(summary['chords'])['C'] == 3 + 3 + 2  # as I, IV or V of I-vi-IV-V twice, then as V or I of ii-V-I
+
+
+def test_bad_records_are_skipped(tmp_path, capsys):
+    path = write_lines(tmp_path / 'corpus.jsonl', [
+        '{"progression": "I-IV-V"}',
+        '{"progression": ',
+        'not json',
+        '{"progression": 42}',
+        '{"progression": ["I", "V"]}',
+        '{"progression": null}',
+        '{"other": "I-V"}',
+        '[1, 2]',
+        '{"progression": "I-Q-V"}',
+        '{"progression": "I-IV-V"}',
+    ])
+    summary = run_json(capsys, [path, '--json', '--workers', '1'])
+    assert summary['progressions'] == 2
+    assert summary['skipped'] == 8
+
+
+def test_csv_column(tmp_path, capsys):
+    path = write_lines(tmp_path / 'corpus.csv', ['title,chords', 'a,I-V', 'b,', 'c,vi-IV'])
+    summary = run_json(capsys, [path, '--column', 'chords', '--json', '--workers', '1'])
+    assert summary['progressions'] == 2
+    assert list(read_progressions(path, 'chords')) == ['I-V', 'vi-IV']
+
+
+def test_text_summary(tmp_path, capsys):
+    path = write_lines(tmp_path / 'corpus.jsonl', ['"I-V"', 'oops'])
+    assert main([path, '--workers', '1']) == 0
+    output = capsys.readouterr().out
+    assert output.startswith('1 progressions in 12 keys (1 skipped)')
+    assert 'Transitions:' in output
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3])
+def test_process_pool_matches_serial(chunk_size):
+    progressions = ['I-vi-IV-V', 'ii-V-I', None, 'bVII-IV-I', 'I-Q', 'I-vi-IV-V'] * 3
+    serial = analyze_corpus(progressions, chunk_size, workers=1)
+    pooled = analyze_corpus(progressions, chunk_size, workers=2)
+    assert pooled == serial
+    assert serial['skipped'] == 6
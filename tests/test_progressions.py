@@ -0,0 +1,63 @@
+import pytest
+
+from music_core.chords import get_chord_type_from_part, progression_to_root_notes
+from music_core.progressions import parse_chord, parse_progression, realize_progression
+
+
+@pytest.mark.parametrize('part, chord_type', [
+    ('I', 'major'),
+    ('i', 'minor'),
+    ('ii7', 'minor_7th'),
+    ('V7', 'dominant_7th'),
+    ('Imaj7', 'major_7th'),
+    ('IM7', 'major_7th'),
+    ('vm6', 'minor_6th'),
+    ('IV6', '6th'),
+    ('Iadd9', 'add9'),
+    ('viadd9', 'minor_add9'),
+    ('IVm7', 'minor_7th'),
+    ('viim7(b5)', 'half_diminished_7th'),
+    ('viiø7', 'half_diminished_7th'),
+    ('vii°', 'diminished'),
+    ('viidim7', 'diminished_7th'),
+    ('III+', 'augmented'),
+    ('Vsus2', 'suspended_2nd'),
+    ('Vsus4', 'suspended_4th'),
+    ('IP', 'power'),
+])
+def test_chord_types(part, chord_type):
+    assert parse_chord(part).chord_type == chord_type
+    assert get_chord_type_from_part(part) == chord_type
+
+
+def test_accidentals_and_slash_bass():
+    node = parse_chord('bVIImaj7/I')
+    assert node.numeral.accidental == -1
+    assert node.numeral.interval == 10
+    assert node.bass.interval == 0
+    assert parse_chord('#iv°').numeral.interval == 6
+
+
+def test_parse_progression_returns_one_node_per_chord():
+    nodes = parse_progression('ii7 - V7 - Imaj7')
+    assert [node.chord_type for node in nodes] == ['minor_7th', 'dominant_7th', 'major_7th']
+    assert [node.numeral.text for node in nodes] == ['ii', 'V', 'I']
+
+
+def test_realize_progression_transposes():
+    assert realize_progression('C', 'I-vi-IV-V') == (
+        ('C', 'major', None), ('A', 'minor', None), ('F', 'major', None), ('G', 'major', None),
+    )
+    assert [chord.root for chord in realize_progression('A', 'bVII-IV/I')] == ['G', 'D']
+    assert realize_progression('A', 'IV/I')[0].bass == 'A'
+    assert progression_to_root_notes('G', 'vi-vm6-I-IV') == ['E', 'D', 'G', 'C']
+
+
+@pytest.mark.parametrize('progression', ['X', 'I-', 'I--V', 'I7x', 'iimaj7', ''])
+def test_invalid_progressions_raise_value_error(progression):
+    with pytest.raises(ValueError):
+        parse_progression(progression)
+
+
+def test_parses_are_cached():
+    assert parse_progression('I-IV-V') is parse_progression('I-IV-V')
@@ -0,0 +1,36 @@
+from render_cache import RenderCache
+
+
+def test_hits_and_misses():
+    cache = RenderCache()
+    renders = []
+
+    def render():
+        renders.append(1)
+        return b'png'
+
+    assert cache.get_or_render('C major', render) == b'png'
+    assert cache.get_or_render('C major', render) == b'png'
+    assert len(renders) == 1
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'size': 1, 'maxsize': 128}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = RenderCache(maxsize=2)
+    cache.get_or_render('a', lambda: 'A')
+    cache.get_or_render('b', lambda: 'B')
+    cache.get_or_render('a', lambda: 'unused')  # 'a' is now the most recent
+    cache.get_or_render('c', lambda: 'C')
+
+    assert len(cache) == 2
+    assert cache.get_or_render('a', lambda: 'new A') == 'A'
+    assert cache.get_or_render('b', lambda: 'new B') == 'new B'
+    assert cache.stats()['misses'] == 4
+
+
+def test_clear_resets_counters():
+    cache = RenderCache()
+    cache.get_or_render('a', lambda: 'A')
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()['misses'] == 0
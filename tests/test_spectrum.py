@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from spectrum import beat_frequencies, compute_spectrum
+
+
+def test_single_note_peak():
+    bin_frequencies, magnitudes = compute_spectrum([440.0])
+    peak = magnitudes.argmax()
+    assert bin_frequencies[peak] == pytest.approx(440.0)
+    assert magnitudes[peak] == pytest.approx(1.0, abs=0.01)
+    assert not magnitudes.flags.writeable
+
+
+def test_chord_peaks_and_caching():
+    frequencies = [261.63, 329.63, 392.0]
+    bin_frequencies, magnitudes = compute_spectrum(frequencies)
+    top = np.sort(bin_frequencies[np.argsort(magnitudes)[-3:]])
+    np.testing.assert_allclose(top, np.round(frequencies), atol=1)
+    assert compute_spectrum(list(reversed(frequencies)))[1] is magnitudes
+
+
+def test_beat_frequencies():
+    assert beat_frequencies([440.0, 442.0, 445.0]) == (
+        (440.0, 442.0, 2.0),
+        (440.0, 445.0, 5.0),
+        (442.0, 445.0, 3.0),
+    )
+    assert beat_frequencies([330.0]) == ()
+
+
+def test_same_pitch_on_two_strings_has_no_beat():
+    # B string fret 5 and the open high E are both E4
+    beats = beat_frequencies([329.63, 329.63, 246.94])
+    assert beats == ((246.94, 329.63, pytest.approx(82.69)),)
@@ -0,0 +1,16 @@
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'benchmarks'))
+
+from startup_profile import HEAVY_PACKAGES, module_level_imports  # noqa: E402
+
+
+def test_app_cold_start_skips_plotting_packages():
+    code = module_level_imports(os.path.join(REPO_ROOT, 'app.py')) + '\nimport sys\nprint("\\n".join(sys.modules))'
+    result = subprocess.run([sys.executable, '-c', code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    loaded = {name.split('.')[0] for name in result.stdout.split()}
+    assert 'streamlit' in loaded
+    assert not loaded.intersection(HEAVY_PACKAGES)
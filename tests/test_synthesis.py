@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from synthesis import SineWave, note_waveform, sine_wavetable
+
+
+def mixed_waves():
+    return [
+        SineWave(220.0, duration=0.5),
+        SineWave(330.0, amplitude=0.5, phase=np.pi / 3, duration=0.3),
+        SineWave(441.5, amplitude=0.25, phase=1.0, duration=0.1234),
+    ]
+
+
+@pytest.mark.parametrize('block_size', [4096, 1000, 7])
+def test_stream_combined_matches_combine_waves(block_size):
+    waves = mixed_waves()
+    streamed = np.concatenate([block.copy() for block in SineWave.stream_combined(waves, block_size=block_size)])
+    expected = SineWave.combine_waves(mixed_waves())
+    assert len(streamed) == len(expected) == waves[0].num_samples
+    np.testing.assert_allclose(streamed, expected, atol=1e-9)
+
+
+def test_blocks_are_bounded_and_float32_available():
+    blocks = [len(block) for block in SineWave.stream_combined(mixed_waves(), block_size=4096)]
+    assert max(blocks) == 4096
+    assert sum(blocks) == 22050
+    block = next(SineWave.stream_combined(mixed_waves(), dtype=np.float32))
+    assert block.dtype == np.float32
+
+
+def test_wave_matches_closed_form():
+    wave = SineWave(330.0, amplitude=0.5, phase=0.25, duration=0.1)
+    time = np.arange(wave.num_samples) / wave.sample_rate
+    np.testing.assert_allclose(wave.wave, 0.5 * np.sin(2 * np.pi * 330.0 * time + 0.25), atol=1e-6)
+    assert len(wave.time) == len(np.arange(0, 0.1, 1 / 44100))
+
+
+@pytest.mark.parametrize('frequency, phase', [(82.41, 0.0), (440.0, 0.5), (1318.51, 2.0)])
+def test_note_waveform_stays_close_to_sine(frequency, phase):
+    wave = note_waveform(frequency, 1.0, phase, 44100, 44100)
+    time = np.arange(44100) / 44100
+    assert np.abs(wave - np.sin(2 * np.pi * frequency * time + phase)).max() < 1e-6
+
+
+def test_cached_arrays_are_read_only():
+    wave = note_waveform(440.0, 0.5, 0.0, 44100, 1000)
+    assert note_waveform(440.0, 0.5, 0.0, 44100, 1000) is wave
+    assert SineWave(440.0, amplitude=0.5, duration=1000 / 44100).wave is wave
+    for array in (wave, sine_wavetable()):
+        assert not array.flags.writeable
+        with pytest.raises(ValueError):
+            array[0] = 1.0
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from timbre import TIMBRES, adsr_envelope, partial_count, render_chord, render_tone
+
+
+def test_partials_stay_below_nyquist():
+    for frequency in (82.41, 440.0, 3000.0, 15000.0):
+        count = partial_count(frequency, 44100)
+        assert count >= 1
+        assert count == 1 or count * frequency < 44100 / 2
+
+
+@pytest.mark.parametrize('timbre', TIMBRES)
+def test_render_tone_length_and_envelope(timbre):
+    tone = render_tone(220.0, 0.5, timbre)
+    assert len(tone) == 22050
+    assert np.isfinite(tone).all()
+    assert tone[0] == 0.0 and abs(tone[-1]) < 1e-3
+    assert np.abs(tone).max() > 0.1
+
+
+def test_float32_tone_tracks_float64():
+    reference = render_tone(440.0, 1.0, 'square')
+    single = render_tone(440.0, 1.0, 'square', dtype=np.float32)
+    assert single.dtype == np.float32
+    np.testing.assert_allclose(single, reference, atol=1e-3)
+
+
+def test_adsr_envelope_shape():
+    envelope = adsr_envelope(1000, 1000, 0.1, 0.1, 0.5, 0.2)
+    assert envelope[100] == 1.0
+    assert envelope[200:800].tolist() == [0.5] * 600
+    assert 0.0 < envelope[-1] < 0.01  # one sample short of silence
+
+
+def test_render_chord_is_sum_of_tones():
+    frequencies = (110.0, 164.81, 220.0)
+    chord = render_chord(frequencies, 0.25, 'pluck')
+    expected = sum(render_tone(frequency, 0.25, 'pluck') for frequency in frequencies)
+    np.testing.assert_allclose(chord, expected)
+
+
+def test_unknown_timbre():
+    with pytest.raises(ValueError):
+        render_tone(220.0, 0.1, 'organ')
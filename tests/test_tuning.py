@@ -0,0 +1,29 @@
+import pytest
+
+from music_core.tuning import fretboard_frequencies, fretboard_midi, midi_to_frequency, midi_to_note, standard_tuning, tunings
+
+
+@pytest.mark.parametrize('tuning_name', list(tunings))
+def test_string_names_match_open_pitches(tuning_name):
+    tuning = tunings[tuning_name]
+    names = [name for name, _ in tuning]
+    assert len(set(names)) == len(names)  # names double as widget keys
+    for name, open_midi in tuning:
+        assert name.split('_')[0] in midi_to_note(open_midi).split('/')
+
+
+def test_tunings_run_low_to_high():
+    assert tunings['Standard'] is standard_tuning
+    for tuning in tunings.values():
+        assert [midi for _, midi in tuning] == sorted(midi for _, midi in tuning)
+
+
+def test_fretboard_frequencies_follow_a4():
+    frequencies = fretboard_frequencies(standard_tuning, 13)
+    assert frequencies.shape == (6, 13)
+    assert frequencies[1, 0] == pytest.approx(110.0)  # open A string
+    assert frequencies[5, 5] == pytest.approx(440.0)  # A4 on the high E string
+    assert not frequencies.flags.writeable
+    assert fretboard_frequencies(standard_tuning, 13, a4=432.0)[5, 5] == pytest.approx(432.0)
+    assert fretboard_midi(tunings['Drop D'], 13)[0][2] == 40
+    assert midi_to_frequency(60) == pytest.approx(261.6256, abs=1e-4)
@@ -0,0 +1,59 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from music_core.notes import note_index
+from music_core.voicings import voicing_midi
+from voice_leading import candidate_arrays, movement_costs, optimize_voice_leading, progression_voicings
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'app.py')
+
+
+def test_movement_costs_shape_and_diagonal():
+    c_major = candidate_arrays('C', 'major')
+    costs = movement_costs(c_major, c_major)
+    assert costs.shape == (len(c_major[0]), len(c_major[0]))
+    assert not np.diag(costs).any()  # staying on the same shape costs nothing
+
+
+def test_viterbi_matches_brute_force():
+    chords = [('C', 'major'), ('A', 'minor'), ('F', 'major')]
+    first, second, third = (candidate_arrays(root, chord_type) for root, chord_type in chords)
+    totals = (first[4][:, None, None] + movement_costs(first, second)[:, :, None] + second[4][None, :, None]
+              + movement_costs(second, third)[None, :, :] + third[4][None, None, :])
+
+    voicings, cost = optimize_voice_leading(chords)
+    assert cost == pytest.approx(totals.min())
+    assert len(voicings) == 3
+
+
+def test_progression_voicings_play_the_right_chords():
+    chords, _ = progression_voicings('ii7-V7-Imaj7', 'C')
+    assert [(root, chord_type) for root, chord_type, _ in chords] == [('D', 'minor_7th'), ('G', 'dominant_7th'), ('C', 'major_7th')]
+    for root, _, voicing in chords:
+        assert voicing_midi(voicing)[0] % 12 == note_index[root]  # root in the bass
+
+
+def test_voice_leading_does_not_load_the_audio_stack():
+    code = "import sys, voice_leading; print(sorted({'progression_audio', 'timbre', 'synthesis'} & set(sys.modules)))"
+    result = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(APP), capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == '[]'
+
+
+def test_empty_progression():
+    assert optimize_voice_leading([]) == ([], 0.0)
+
+
+def test_suggest_smooth_voicings_in_app():
+    pytest.importorskip('streamlit')
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(APP, default_timeout=120).run()
+    app.checkbox(key='chord_progression_GO').check().run()
+    app.checkbox(key='progression_voice_leading').check().run()
+
+    assert not app.exception
+    assert len(app.table) == 1
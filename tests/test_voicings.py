@@ -0,0 +1,83 @@
+import pytest
+
+from music_core.chords import chord_intervals
+from music_core.notes import note_index
+from music_core.tuning import tunings
+from music_core.voicings import find_voicings, format_voicing, voicing_midi
+
+
+def chart(voicings):
+    return [format_voicing(voicing) for voicing in voicings]
+
+
+def is_playable(voicing, root_note, chord_type, tuning, max_span):
+    chord_pitch_classes = {(note_index[root_note] + interval) % 12 for interval in chord_intervals[chord_type]}
+    pitch_classes = [midi % 12 for midi in voicing_midi(voicing, tuning)]
+    fretted = [fret for fret in voicing if fret]
+    sounding = [string for string, fret in enumerate(voicing) if fret is not None]
+    return (
+        set(pitch_classes) == chord_pitch_classes
+        and (not fretted or max(fretted) - min(fretted) <= max_span)
+        and sounding == list(range(sounding[0], sounding[-1] + 1))  # mutes only at the edges
+    )
+
+
+@pytest.mark.parametrize('root_note, chord_type, shape', [
+    ('C', 'major', 'x32010'),
+    ('G', 'major', '320003'),
+    ('E', 'minor', '022000'),
+    ('A', 'minor', 'x02210'),
+    ('D', 'major', 'xx0232'),
+    ('E', 'dominant_7th', '020100'),
+    ('F', 'major', '133211'),
+])
+def test_familiar_open_shapes(root_note, chord_type, shape):
+    assert shape in chart(find_voicings(root_note, chord_type))
+
+
+@pytest.mark.parametrize('root_note, chord_type', [('C', 'major'), ('A', 'minor_7th'), ('B', 'diminished'), ('F#/Gb', '6th')])
+def test_every_voicing_is_playable(root_note, chord_type):
+    voicings = find_voicings(root_note, chord_type)
+    assert voicings
+    for voicing in voicings:
+        assert is_playable(voicing, root_note, chord_type, tunings['Standard'], max_span=3)
+        assert voicing_midi(voicing)[0] % 12 == note_index[root_note]
+        assert sum(fret is not None for fret in voicing) >= 3
+
+
+def test_ordered_by_position_then_span():
+    keys = []
+    for voicing in find_voicings('G', 'major'):
+        fretted = [fret for fret in voicing if fret] or [0]
+        keys.append((min(fretted), max(fretted) - min(fretted)))
+    assert keys == sorted(keys)
+
+
+def test_constraints():
+    assert all(0 not in voicing for voicing in find_voicings('C', 'major', allow_open=False))
+    assert all(
+        max(fret for fret in voicing if fret) - min(fret for fret in voicing if fret) <= 2
+        for voicing in find_voicings('C', 'major', max_span=2)
+        if any(voicing)
+    )
+    with_bass = set(find_voicings('C', 'major'))
+    any_bass = set(find_voicings('C', 'major', root_in_bass=False))
+    assert with_bass < any_bass
+    assert '032010' in chart(any_bass)  # C/E
+    assert all(sum(fret is not None for fret in voicing) >= 4 for voicing in find_voicings('C', 'major', min_strings=4))
+
+
+def test_alternate_tuning():
+    drop_d = tunings['Drop D']
+    voicings = find_voicings('D', 'power', drop_d)
+    assert (0, 0, 0, None, None, None) in voicings
+    assert voicing_midi((0, 0, 0, None, None, None), drop_d) == [38, 45, 50]
+
+
+def test_results_are_memoized():
+    assert find_voicings('A', 'minor') is find_voicings('A', 'minor')
+
+
+def test_format_voicing():
+    assert format_voicing((None, 3, 2, 0, 1, 0)) == 'x32010'
+    assert format_voicing((None, None, 10, 12, 13, 12)) == 'x-x-10-12-13-12'
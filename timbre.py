@@ -0,0 +1,97 @@
+"""
+Band-limited multi-timbre tones built from harmonic partials.
+
+Each note is a weighted sum of its harmonics, computed as one (partials x samples) sine matrix
+reduced against the partial weights. Partials at or above Nyquist are never generated, so
+there is no aliasing, and max_partials caps the work for low notes. The note is rendered in
+fixed-size time blocks so the matrix stays small however long the note is.
+"""
+import numpy as np
+
+
+TIMBRES = ('sine', 'saw', 'square', 'pluck')
+DEFAULT_MAX_PARTIALS = 32
+BLOCK_SIZE = 8192
+
+# attack, decay, release in seconds; sustain as a fraction of the peak
+default_adsr = {
+    'sine': (0.01, 0.05, 0.9, 0.05),
+    'saw': (0.01, 0.1, 0.7, 0.1),
+    'square': (0.01, 0.1, 0.7, 0.1),
+    'pluck': (0.002, 0.0, 1.0, 0.05),  # the pluck decays through its partials instead
+}
+
+
+def partial_count(frequency, sample_rate, max_partials=DEFAULT_MAX_PARTIALS):
+    below_nyquist = int(np.ceil(sample_rate / 2 / frequency)) - 1
+    return max(1, min(max_partials, below_nyquist))
+
+
+def partial_weights(timbre, count):
+    """Amplitude of harmonics 1..count for a timbre (Fourier series of the ideal waveform)."""
+    harmonics = np.arange(1, count + 1, dtype=np.float64)
+    if timbre == 'sine':
+        weights = np.zeros(count)
+        weights[0] = 1.0
+    elif timbre == 'saw':
+        weights = (2 / np.pi) / harmonics
+    elif timbre == 'square':
+        weights = np.where(harmonics % 2 == 1, (4 / np.pi) / harmonics, 0.0)
+    elif timbre == 'pluck':
+        # Roughly a string plucked near the bridge: bright attack, upper partials fade first
+        weights = 1 / harmonics ** 1.5
+    else:
+        raise ValueError(f"Unknown timbre {timbre!r}, expected one of {TIMBRES}")
+    return weights
+
+
+def adsr_envelope(num_samples, sample_rate, attack, decay, sustain, release, dtype=np.float64):
+    """Piecewise-linear ADSR envelope; the release fades out at the end of the buffer."""
+    attack_end = min(num_samples, int(attack * sample_rate))
+    decay_end = min(num_samples, attack_end + int(decay * sample_rate))
+    release_start = max(decay_end, num_samples - int(release * sample_rate))
+    times = np.array([0, attack_end, decay_end, release_start, num_samples], dtype=np.float64)
+    levels = np.array([0.0, 1.0, sustain, sustain, 0.0])
+    return np.interp(np.arange(num_samples), times, levels).astype(dtype, copy=False)
+
+
+def render_tone(frequency, duration, timbre='saw', sample_rate=44100, amplitude=1.0,
+                max_partials=DEFAULT_MAX_PARTIALS, adsr=None, dtype=np.float64):
+    num_samples = int(np.ceil(duration * sample_rate))
+    count = partial_count(frequency, sample_rate, max_partials)
+    weights = (partial_weights(timbre, count) * amplitude).astype(dtype)
+    keep = weights != 0  # e.g. even harmonics of a square wave
+    weights = weights[keep]
+    harmonics = np.arange(1, count + 1, dtype=np.float64)[keep]
+    angular_steps = (2 * np.pi * frequency / sample_rate) * harmonics  # radians per sample, per partial
+    # Higher partials of a pluck die away faster (per-sample decay rates)
+    decay_rates = (1.5 + 0.8 * harmonics) / sample_rate if timbre == 'pluck' else None
+
+    tone = np.empty(num_samples, dtype=dtype)
+    ramp = np.arange(BLOCK_SIZE, dtype=dtype)
+    block_steps = angular_steps.astype(dtype)
+    for start in range(0, num_samples, BLOCK_SIZE):
+        local = ramp[:min(BLOCK_SIZE, num_samples - start)]
+        # Phases stay relative to the block start (wrapped in float64) so float32 keeps its precision
+        partials = np.outer(block_steps, local)
+        partials += np.mod(angular_steps * start, 2 * np.pi).astype(dtype)[:, None]
+        np.sin(partials, out=partials)
+        if decay_rates is not None:
+            partials *= np.exp(-np.outer(decay_rates, local).astype(dtype)) * np.exp(-decay_rates * start).astype(dtype)[:, None]
+        np.dot(weights, partials, out=tone[start:start + len(local)])
+
+    attack, decay, sustain, release = adsr or default_adsr[timbre]
+    tone *= adsr_envelope(num_samples, sample_rate, attack, decay, sustain, release, dtype)
+    return tone
+
+
+def render_chord(frequencies, duration, timbre='saw', sample_rate=44100, **tone_options):
+    """Sum of render_tone for every frequency."""
+    mix = None
+    for frequency in frequencies:
+        tone = render_tone(frequency, duration, timbre, sample_rate, **tone_options)
+        if mix is None:
+            mix = tone
+        else:
+            mix += tone
+    return mix
@@ -0,0 +1,95 @@
+"""
+Voice-leading optimizer: picks one guitar voicing per chord so the whole progression moves as
+little as possible.
+
+Every chord's candidates come from music_core.voicings. The movement cost between two
+consecutive candidate sets is a single broadcast (A, B) matrix covering:
+- semitones each shared string moves,
+- strings that switch between muted and sounding,
+- how far the hand shifts along the neck.
+A Viterbi pass over the chords then finds the cheapest path in O(chords x A x B) with no Python
+loop over candidates.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from music_core.progressions import progression_chords
+from music_core.tuning import standard_tuning
+from music_core.voicings import DEFAULT_MAX_SPAN, find_voicings
+
+
+# Movement weights
+VOICE_WEIGHT = 1.0  # per semitone a sounding string moves
+MUTE_CHANGE_WEIGHT = 3.0  # per string that is muted in one chord and sounding in the other
+HAND_WEIGHT = 2.0  # per fret the hand position shifts
+# Per-shape weights, so the optimizer does not favour thin or awkward shapes just because they move less
+SPAN_WEIGHT = 1.0
+MUTED_STRING_WEIGHT = 1.5
+POSITION_WEIGHT = 0.2
+
+
+@lru_cache(maxsize=256)
+def candidate_arrays(root_note, chord_type, tuning=standard_tuning, max_span=DEFAULT_MAX_SPAN):
+    """(voicings, midi, sounding, hand position, shape cost) for one chord; midi is 0 on muted strings."""
+    voicings = find_voicings(root_note, chord_type, tuning, max_span=max_span)
+    if not voicings:
+        raise ValueError(f"No playable voicing for {root_note} {chord_type} within a {max_span}-fret span")
+
+    frets = np.array([[-1 if fret is None else fret for fret in voicing] for voicing in voicings], dtype=np.int16)
+    sounding = frets >= 0
+    open_midi = np.array([midi for _, midi in tuning], dtype=np.int16)
+    midi = np.where(sounding, frets + open_midi, 0)
+
+    fretted = frets > 0
+    masked = np.where(fretted, frets, 0)
+    lowest = np.where(fretted, frets, np.iinfo(np.int16).max).min(axis=1)
+    position = np.where(fretted.any(axis=1), lowest, 0)
+    span = np.where(fretted.any(axis=1), masked.max(axis=1) - position, 0)
+    shape_cost = (SPAN_WEIGHT * span + MUTED_STRING_WEIGHT * (~sounding).sum(axis=1) + POSITION_WEIGHT * position)
+
+    for array in (midi, sounding, position, shape_cost):
+        array.setflags(write=False)
+    return voicings, midi, sounding, position, shape_cost
+
+
+def movement_costs(previous, current):
+    """(A, B) cost of moving from every candidate in previous to every candidate in current."""
+    _, midi_a, sounding_a, position_a, _ = previous
+    _, midi_b, sounding_b, position_b, _ = current
+    shared = sounding_a[:, None, :] & sounding_b[None, :, :]
+    voice = np.where(shared, np.abs(midi_a[:, None, :] - midi_b[None, :, :]), 0).sum(axis=2)
+    mute_changes = (sounding_a[:, None, :] != sounding_b[None, :, :]).sum(axis=2)
+    hand = np.abs(position_a[:, None] - position_b[None, :])
+    return VOICE_WEIGHT * voice + MUTE_CHANGE_WEIGHT * mute_changes + HAND_WEIGHT * hand
+
+
+def optimize_voice_leading(chords, tuning=standard_tuning, max_span=DEFAULT_MAX_SPAN):
+    """Cheapest voicing per (root note, chord type); returns (voicings, total cost)."""
+    if not chords:
+        return [], 0.0
+    candidates = [candidate_arrays(root, chord_type, tuning, max_span) for root, chord_type in chords]
+
+    totals = candidates[0][4].astype(np.float64)
+    backpointers = []
+    for previous, current in zip(candidates, candidates[1:]):
+        paths = totals[:, None] + movement_costs(previous, current)
+        best = paths.argmin(axis=0)
+        backpointers.append(best)
+        totals = paths[best, np.arange(len(best))] + current[4]
+
+    choice = int(totals.argmin())
+    total_cost = float(totals[choice])
+    picks = [choice]
+    for best in reversed(backpointers):
+        choice = int(best[choice])
+        picks.append(choice)
+    picks.reverse()
+    return [voicings[pick] for (voicings, *_), pick in zip(candidates, picks)], total_cost
+
+
+def progression_voicings(progression, key, tuning=standard_tuning, max_span=DEFAULT_MAX_SPAN):
+    """optimize_voice_leading for a progression like 'I-vi-IV-V'; returns [(root, type, voicing)], total cost."""
+    chords = progression_chords(progression, key)
+    voicings, total_cost = optimize_voice_leading(chords, tuning, max_span)
+    return [(root, chord_type, voicing) for (root, chord_type), voicing in zip(chords, voicings)], total_cost